@@ -4,12 +4,21 @@ Streamlit Web Interface for Resume Screening System
 
 import streamlit as st
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_toolbelt import MultipartEncoder
+import orjson
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
+import math
+from heapq import nlargest
+from operator import itemgetter
 
 # Page configuration
 st.set_page_config(
@@ -22,122 +31,348 @@ st.set_page_config(
 # API Configuration
 API_BASE_URL = "http://localhost:8000"
 
+# Candidates shown per page of batch results
+RESULTS_PAGE_SIZE = 10
+
 # Custom CSS
+# Theme colors live in .streamlit/config.toml; only the classes the pages use remain
+# here so the style element re-sent on each rerun stays small.
 st.markdown("""
 <style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .sub-header {
-        font-size: 1.5rem;
-        color: #ff7f0e;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    .success-box {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        color: #155724;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
-    .warning-box {
-        background-color: #fff3cd;
-        border: 1px solid #ffeeba;
-        color: #856404;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
-    .error-box {
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        color: #721c24;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
+    .main-header {font-size: 3rem; font-weight: bold; color: #1f77b4; text-align: center; margin-bottom: 2rem;}
+    .metric-card {background-color: #f0f2f6; padding: 1rem; border-radius: 0.5rem; margin: 0.5rem 0;}
+    .error-box {background-color: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; padding: 1rem; border-radius: 0.5rem; margin: 1rem 0;}
 </style>
 """, unsafe_allow_html=True)
 
 # Helper Functions
 
+@st.cache_resource
+def api_session():
+    """Shared HTTP session so keep-alive connections are reused across reruns"""
+    session = requests.Session()
+    # Transient gateway errors and dropped connections are retried here rather
+    # than by the user clicking again and rerunning the page
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.25,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Uploads stream their body and cannot be rewound, so they are never retried
+    session.mount(f"{API_BASE_URL}/resume/upload", HTTPAdapter(max_retries=0))
+    return session
+
+@st.cache_data(ttl=10, show_spinner=False)
 def check_api_health():
-    """Check if API is running"""
+    """Check if API is running (probed at most every 10s; a down API fails fast)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        # Bypasses the retrying session so a stopped API is reported at once
+        response = requests.get(f"{API_BASE_URL}/health", timeout=1)
         return response.status_code == 200
     except:
         return False
 
+# API calls return (ok, payload): the decoded body on success, otherwise an
+# error message the page can show. Bodies are encoded and decoded with orjson.
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _result(response):
+    """Turn an API response into (ok, body or error message)"""
+    if response.status_code == 200:
+        return True, orjson.loads(response.content)
+    try:
+        detail = orjson.loads(response.content).get('detail')
+    except (ValueError, AttributeError):
+        detail = None
+    return False, f"API returned {response.status_code}" + (f": {detail}" if detail else "")
+
+def _post_resume(session, name, stream, content_type):
+    """POST one resume; makes no Streamlit calls so it is safe in worker threads"""
+    # Stream the multipart body from the file object instead of building it in memory
+    encoder = MultipartEncoder(fields={'file': (name, stream, content_type)})
+    try:
+        response = session.post(
+            f"{API_BASE_URL}/resume/upload",
+            data=encoder,
+            headers={'Content-Type': encoder.content_type}
+        )
+    except requests.RequestException as e:
+        return False, str(e)
+    return _result(response)
+
 def upload_resume(file):
     """Upload resume to API"""
-    try:
-        files = {'file': (file.name, file, file.type)}
-        response = requests.post(f"{API_BASE_URL}/resume/upload", files=files)
-        return response.json() if response.status_code == 200 else None
-    except Exception as e:
-        st.error(f"Error uploading resume: {str(e)}")
-        return None
+    return _post_resume(api_session(), file.name, BytesIO(file.getvalue()), file.type)
+
+# Profiles and single matches are deterministic per input, so they are
+# persisted to disk and survive app restarts. The cached fetchers raise on any
+# failure so that errors are never stored.
+
+@st.cache_data(persist="disk", max_entries=1000, show_spinner=False)
+def _fetch_profile(filename):
+    """Fetch a candidate profile, raising on failure"""
+    response = api_session().get(f"{API_BASE_URL}/resume/profile/{filename}")
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 def get_profile(filename):
     """Get candidate profile from API"""
     try:
-        response = requests.get(f"{API_BASE_URL}/resume/profile/{filename}")
-        return response.json() if response.status_code == 200 else None
-    except Exception as e:
-        st.error(f"Error getting profile: {str(e)}")
-        return None
+        return True, _fetch_profile(filename)
+    except requests.HTTPError as e:
+        return _result(e.response)
+    except requests.RequestException as e:
+        return False, str(e)
 
-def match_single(filename, job_data):
-    """Match single resume to job"""
+def _post_match(session, filename, job_data):
+    """POST one single-resume match; makes no Streamlit calls so it is safe in worker threads"""
+    params = {"filename": filename}
     try:
-        params = {"filename": filename}
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/match/single",
             params=params,
-            json=job_data
+            data=orjson.dumps(job_data),
+            headers=JSON_HEADERS
         )
-        return response.json() if response.status_code == 200 else None
-    except Exception as e:
-        st.error(f"Error matching resume: {str(e)}")
-        return None
+    except requests.RequestException as e:
+        return False, str(e)
+    return _result(response)
+
+@st.cache_data(persist="disk", max_entries=1000, show_spinner=False)
+def _fetch_match(filename, job_json):
+    """Match one resume against a JSON-encoded job, raising on failure"""
+    response = api_session().post(
+        f"{API_BASE_URL}/match/single",
+        params={"filename": filename},
+        data=job_json,
+        headers=JSON_HEADERS
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def match_single(filename, job_data):
+    """Match single resume to job"""
+    try:
+        return True, _fetch_match(filename, orjson.dumps(job_data, option=orjson.OPT_SORT_KEYS))
+    except requests.HTTPError as e:
+        return _result(e.response)
+    except requests.RequestException as e:
+        return False, str(e)
 
 def match_batch(job_data, resume_filenames=None):
     """Match multiple resumes to job"""
+    request_data = {
+        "job_description": job_data,
+        "resume_filenames": resume_filenames
+    }
     try:
-        request_data = {
-            "job_description": job_data,
-            "resume_filenames": resume_filenames
-        }
-        response = requests.post(f"{API_BASE_URL}/match/batch", json=request_data)
-        return response.json() if response.status_code == 200 else None
-    except Exception as e:
-        st.error(f"Error batch matching: {str(e)}")
-        return None
+        response = api_session().post(
+            f"{API_BASE_URL}/match/batch",
+            data=orjson.dumps(request_data),
+            headers=JSON_HEADERS
+        )
+    except requests.RequestException as e:
+        return False, str(e)
+    return _result(response)
+
+def match_selected(job_data, resume_filenames):
+    """
+    Match an explicit list of resumes by fanning out concurrent /match/single calls
+    
+    Returns the same shape as the /match/batch response, so latency is bounded by
+    the slowest match rather than the sum of all of them. Resumes that fail to
+    match are left out, as the batch endpoint does.
+    """
+    start_time = time.time()
+    session = api_session()
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda filename: _post_match(session, filename, job_data),
+            resume_filenames
+        ))
+    
+    matches = [payload for ok, payload in results if ok]
+    if not matches and results:
+        # Nothing matched; surface the first failure
+        return results[0]
+    matches.sort(key=lambda m: m['overall_score'], reverse=True)
+    
+    return True, {
+        "job_title": job_data['title'],
+        "total_candidates": len(matches),
+        "matches": matches,
+        "processing_time": round(time.time() - start_time, 2)
+    }
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_resumes():
+    """Fetch the list of uploaded resumes, raising on failure"""
+    response = api_session().get(f"{API_BASE_URL}/resumes/list")
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 def list_resumes():
     """Get list of uploaded resumes"""
     try:
-        response = requests.get(f"{API_BASE_URL}/resumes/list")
-        return response.json() if response.status_code == 200 else None
-    except Exception as e:
-        st.error(f"Error listing resumes: {str(e)}")
-        return None
+        return True, _fetch_resumes()
+    except requests.HTTPError as e:
+        return _result(e.response)
+    except requests.RequestException as e:
+        return False, str(e)
+
+def get_resumes():
+    """Resume list for this session, fetched once and reused until the next upload"""
+    if st.session_state.get("resumes_data") is None:
+        ok, payload = list_resumes()
+        if not ok:
+            st.error(f"Error listing resumes: {payload}")
+            return None
+        st.session_state["resumes_data"] = payload
+    return st.session_state["resumes_data"]
+
+def invalidate_resumes():
+    """Drop cached resume data so the next read sees new uploads"""
+    st.session_state.pop("resumes_data", None)
+    _fetch_resumes.clear()
+    # A re-uploaded file keeps its name, so per-file results may be stale too
+    _fetch_profile.clear()
+    _fetch_match.clear()
+
+# Charts
+#
+# Figures are cached on their inputs and drawn inside fragments, so unrelated
+# widget interactions neither rebuild nor re-send them. A light default
+# template is set once so each new figure merges less theme data.
+
+pio.templates.default = "simple_white"
+
+@st.cache_data(show_spinner=False)
+def _gauge_figure(score):
+    """Build the overall-fit gauge for a score"""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=score,
+        title={'text': "Overall Fit Score"},
+        delta={'reference': 70},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 40], 'color': "lightgray"},
+                {'range': [40, 60], 'color': "lightyellow"},
+                {'range': [60, 80], 'color': "lightgreen"},
+                {'range': [80, 100], 'color': "green"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 70
+            }
+        }
+    ))
+    
+    fig.update_layout(height=300)
+    return fig
+
+@st.fragment
+def _gauge(score):
+    """Render the overall-fit gauge"""
+    st.plotly_chart(_gauge_figure(score), use_container_width=True)
+
+@st.cache_data(show_spinner=False)
+def _score_hist_figure(scores):
+    """Build the candidate score histogram"""
+    return px.histogram(
+        list(scores),
+        nbins=10,
+        title="Candidate Score Distribution",
+        labels={'value': 'Score', 'count': 'Number of Candidates'}
+    )
+
+@st.fragment
+def _score_hist(scores):
+    """Render the candidate score histogram"""
+    st.plotly_chart(_score_hist_figure(scores), use_container_width=True)
+
+@st.cache_data(show_spinner=False)
+def _top_skills_figure(skills, counts):
+    """Build the most-mentioned skills bar chart"""
+    fig = px.bar(
+        x=list(counts),
+        y=list(skills),
+        orientation='h',
+        labels={'x': 'Mentions', 'y': 'Skill'},
+        title="Top 10 Skills"
+    )
+    fig.update_layout(showlegend=False, height=400)
+    return fig
 
 # Main App
 
+# Page slug (as used in the ?page= query parameter) -> sidebar label
+PAGES = {
+    "home": "🏠 Home",
+    "upload": "📤 Upload Resumes",
+    "profiles": "👤 View Profiles",
+    "match": "🎯 Match Candidates",
+    "analytics": "📊 Analytics"
+}
+PAGE_SLUGS = {label: slug for slug, label in PAGES.items()}
+
+def _go_to(slug):
+    """Switch page, keeping the sidebar and the URL in step"""
+    st.session_state.nav = PAGES[slug]
+    st.query_params["page"] = slug
+
+def _sync_page_param():
+    """Mirror the sidebar selection into the URL so pages can be linked"""
+    st.query_params["page"] = PAGE_SLUGS[st.session_state.nav]
+
+@st.fragment
+def _sidebar_stats():
+    """Sidebar resume count"""
+    resumes_data = get_resumes()
+    if resumes_data:
+        st.metric("Total Resumes", resumes_data.get('total', 0))
+
+@st.fragment
+def _system_overview():
+    """Home page resume overview"""
+    st.markdown("### 📊 System Overview")
+    
+    # Get statistics
+    resumes_data = get_resumes()
+    
+    if resumes_data and resumes_data.get('total', 0) > 0:
+        # Create metrics
+        total_resumes = resumes_data['total']
+        
+        metric_col1, metric_col2 = st.columns(2)
+        metric_col1.metric("Total Resumes", total_resumes)
+        metric_col2.metric("Status", "Ready", delta="Active")
+        
+        # Recent uploads
+        st.markdown("#### Recent Uploads")
+        recent = resumes_data['resumes'][:5]
+        st.text("\n".join(f"📄 {resume['filename']} ({resume['size_kb']} KB)" for resume in recent))
+    else:
+        st.info("No resumes uploaded yet. Start by uploading some resumes!")
+        
+        # The callback switches page before this fragment reruns; the sidebar
+        # and page router are outside it, so rerun the whole app
+        if st.button("📤 Go to Upload Page", on_click=_go_to, args=("upload",)):
+            st.rerun(scope="app")
+
 def main():
     # Header
     st.markdown('<p class="main-header">🎯 AI-Powered Resume Screening System</p>', unsafe_allow_html=True)
@@ -158,10 +393,16 @@ def main():
         st.image("https://img.icons8.com/fluency/96/resume.png", width=80)
         st.title("Navigation")
         
+        # The URL decides the starting page; the radio drives it afterwards
+        if "nav" not in st.session_state:
+            st.session_state.nav = PAGES.get(st.query_params.get("page"), PAGES["home"])
+        
         page = st.radio(
             "Select Page",
-            ["🏠 Home", "📤 Upload Resumes", "👤 View Profiles", "🎯 Match Candidates", "📊 Analytics"],
-            label_visibility="collapsed"
+            list(PAGES.values()),
+            label_visibility="collapsed",
+            key="nav",
+            on_change=_sync_page_param
         )
         
         st.markdown("---")
@@ -171,9 +412,7 @@ def main():
         st.success("✅ Connected")
         
         # Quick Stats
-        resumes_data = list_resumes()
-        if resumes_data:
-            st.metric("Total Resumes", resumes_data.get('total', 0))
+        _sidebar_stats()
         
         st.markdown("---")
         st.markdown("### About")
@@ -188,6 +427,8 @@ def main():
         """)
     
     # Main Content
+    # Pages are fragments, so their own widgets rerun just the page and not
+    # the sidebar or the health probe
     if page == "🏠 Home":
         show_home()
     elif page == "📤 Upload Resumes":
@@ -199,6 +440,7 @@ def main():
     elif page == "📊 Analytics":
         show_analytics()
 
+@st.fragment
 def show_home():
     """Home page"""
     
@@ -224,30 +466,7 @@ def show_home():
         """)
     
     with col2:
-        st.markdown("### 📊 System Overview")
-        
-        # Get statistics
-        resumes_data = list_resumes()
-        
-        if resumes_data and resumes_data.get('total', 0) > 0:
-            # Create metrics
-            total_resumes = resumes_data['total']
-            
-            metric_col1, metric_col2 = st.columns(2)
-            metric_col1.metric("Total Resumes", total_resumes)
-            metric_col2.metric("Status", "Ready", delta="Active")
-            
-            # Recent uploads
-            st.markdown("#### Recent Uploads")
-            recent = resumes_data['resumes'][:5]
-            for resume in recent:
-                st.text(f"📄 {resume['filename']} ({resume['size_kb']} KB)")
-        else:
-            st.info("No resumes uploaded yet. Start by uploading some resumes!")
-            
-            if st.button("📤 Go to Upload Page"):
-                st.session_state.page = "📤 Upload Resumes"
-                st.rerun()
+        _system_overview()
     
     # Demo Section
     st.markdown("---")
@@ -279,6 +498,26 @@ def show_home():
         </div>
         """, unsafe_allow_html=True)
 
+def _index_uploads():
+    """Record name, size and type of the selected files once per selection change"""
+    files = st.session_state.get("resume_uploader") or []
+    st.session_state["resume_uploader_meta"] = pd.DataFrame({
+        'File': [f"📄 {f.name}" for f in files],
+        'Size (KB)': [round(f.size / 1024, 1) for f in files],
+        'Type': [f.type.split('/')[-1].upper() for f in files]
+    })
+
+@st.fragment
+def _upload_preview():
+    """Selected-file summary, rendered from the metadata captured on selection"""
+    if "resume_uploader_meta" not in st.session_state:
+        _index_uploads()
+    meta = st.session_state["resume_uploader_meta"]
+    
+    st.markdown(f"### Selected Files: {len(meta)}")
+    st.dataframe(meta, use_container_width=True, hide_index=True)
+
+@st.fragment
 def show_upload():
     """Upload resumes page"""
     
@@ -294,60 +533,78 @@ def show_upload():
         "Choose resume files",
         type=['pdf', 'docx', 'txt'],
         accept_multiple_files=True,
-        help="You can upload multiple files at once"
+        help="You can upload multiple files at once",
+        key="resume_uploader",
+        on_change=_index_uploads
     )
     
     if uploaded_files:
-        st.markdown(f"### Selected Files: {len(uploaded_files)}")
-        
         # Show file details
-        for file in uploaded_files:
-            col1, col2, col3 = st.columns([3, 1, 1])
-            col1.text(f"📄 {file.name}")
-            col2.text(f"{file.size / 1024:.1f} KB")
-            col3.text(file.type.split('/')[-1].upper())
+        _upload_preview()
         
         # Upload button
         if st.button("🚀 Upload All", type="primary"):
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            results = []
+            # Column buffers for the results table
+            fnames, statuses, sizes, tlens = [], [], [], []
             
-            for i, file in enumerate(uploaded_files):
-                status_text.text(f"Uploading {file.name}...")
-                result = upload_resume(file)
-                
-                if result:
-                    results.append({
-                        'filename': result['filename'],
-                        'status': result['processing_status'],
-                        'size': result['file_size'],
-                        'text_length': result['extracted_text_length']
-                    })
+            # Give each worker its own stream; UploadedFile is not safe to seek from several threads
+            payloads = [(file.name, BytesIO(file.getvalue()), file.type) for file in uploaded_files]
+            session = api_session()
+            status_text.text(f"Uploading {len(payloads)} file(s)...")
+            
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    executor.submit(_post_resume, session, *payload): payload[0]
+                    for payload in payloads
+                }
                 
-                progress_bar.progress((i + 1) / len(uploaded_files))
+                for completed, future in enumerate(as_completed(futures), 1):
+                    name = futures[future]
+                    ok, result = future.result()
+                    
+                    if not ok:
+                        st.error(f"Error uploading {name}: {result}")
+                    else:
+                        fnames.append(result['filename'])
+                        statuses.append(result['processing_status'])
+                        sizes.append(result['file_size'])
+                        tlens.append(result['extracted_text_length'])
+                    
+                    status_text.text(f"Uploaded {name}")
+                    progress_bar.progress(completed / len(payloads))
             
             status_text.empty()
             progress_bar.empty()
             
+            if fnames:
+                invalidate_resumes()
+            
             # Show results
-            st.success(f"✅ Successfully uploaded {len(results)} resume(s)!")
+            st.success(f"✅ Successfully uploaded {len(fnames)} resume(s)!")
             
             # Results table
-            if results:
-                df = pd.DataFrame(results)
+            if fnames:
+                df = pd.DataFrame({
+                    'filename': fnames,
+                    'status': statuses,
+                    'size': np.asarray(sizes, dtype=np.int64),
+                    'text_length': np.asarray(tlens, dtype=np.int64)
+                })
                 st.dataframe(df, use_container_width=True)
                 
                 st.balloons()
 
+@st.fragment
 def show_profiles():
     """View candidate profiles page"""
     
     st.markdown("## 👤 Candidate Profiles")
     
     # Get list of resumes
-    resumes_data = list_resumes()
+    resumes_data = get_resumes()
     
     if not resumes_data or resumes_data.get('total', 0) == 0:
         st.warning("No resumes uploaded yet. Please upload some resumes first.")
@@ -360,9 +617,11 @@ def show_profiles():
     if selected_file:
         if st.button("📊 Extract Profile", type="primary"):
             with st.spinner("Extracting profile..."):
-                profile = get_profile(selected_file)
+                ok, profile = get_profile(selected_file)
             
-            if profile:
+            if not ok:
+                st.error(f"Error getting profile: {profile}")
+            else:
                 # Header
                 st.markdown("---")
                 col1, col2 = st.columns([2, 1])
@@ -406,23 +665,11 @@ def show_profiles():
                     st.markdown("##### Most Mentioned Skills")
                     
                     # Get top 10 skills
-                    top_skills = sorted(
-                        skills_data['skill_count'].items(),
-                        key=lambda x: x[1],
-                        reverse=True
-                    )[:10]
+                    top_skills = nlargest(10, skills_data['skill_count'].items(), key=itemgetter(1))
                     
                     skills, counts = zip(*top_skills)
                     
-                    fig = px.bar(
-                        x=list(counts),
-                        y=list(skills),
-                        orientation='h',
-                        labels={'x': 'Mentions', 'y': 'Skill'},
-                        title="Top 10 Skills"
-                    )
-                    fig.update_layout(showlegend=False, height=400)
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(_top_skills_figure(skills, counts), use_container_width=True)
                 
                 # Education
                 st.markdown("#### 🎓 Education")
@@ -434,8 +681,7 @@ def show_profiles():
                     
                     if edu_data['found_degrees']:
                         st.markdown("**Degrees Found:**")
-                        for degree in edu_data['found_degrees']:
-                            st.text(f"• {degree['keyword']} ({degree['level']})")
+                        st.text("\n".join(f"• {degree['keyword']} ({degree['level']})" for degree in edu_data['found_degrees']))
                 else:
                     st.info("No degree information found")
                 
@@ -443,18 +689,18 @@ def show_profiles():
                 st.markdown("#### 📜 Certifications")
                 
                 if profile['certifications']:
-                    for cert in profile['certifications']:
-                        st.text(f"✓ {cert}")
+                    st.text("\n".join(f"✓ {cert}" for cert in profile['certifications']))
                 else:
                     st.info("No certifications found")
 
+@st.fragment
 def show_matching():
     """Match candidates to jobs page"""
     
     st.markdown("## 🎯 Match Candidates to Job")
     
     # Get list of resumes
-    resumes_data = list_resumes()
+    resumes_data = get_resumes()
     
     if not resumes_data or resumes_data.get('total', 0) == 0:
         st.warning("No resumes uploaded yet. Please upload some resumes first.")
@@ -525,9 +771,11 @@ Experience: 5+ years""",
                 "required_years": required_years
             }
             
-            result = match_single(selected_file, job_data)
+            ok, result = match_single(selected_file, job_data)
         
-        if result:
+        if not ok:
+            st.error(f"Error matching resume: {result}")
+        else:
             display_match_result(result)
 
 def show_batch_match(resumes_data):
@@ -597,56 +845,63 @@ Experience: 3+ years""",
                 "required_education": required_education if required_education != "Any" else None
             }
             
-            result = match_batch(job_data, selected_resumes)
+            if selected_resumes:
+                ok, result = match_selected(job_data, selected_resumes)
+            else:
+                ok, result = match_batch(job_data, selected_resumes)
         
-        if result:
-            display_batch_results(result)
-
-def display_match_result(result):
-    """Display single match result"""
+        if not ok:
+            st.error(f"Error batch matching: {result}")
+        
+        # Keep the result so paging through it survives reruns
+        st.session_state.batch_result = result if ok else None
+        st.session_state.batch_results_page = 1
     
-    st.markdown("---")
-    st.markdown("## 📊 Match Results")
+    if st.session_state.get('batch_result'):
+        display_batch_results(st.session_state.batch_result)
+
+def display_match_result(result, compact=False):
+    """Display single match result; compact skips the gauge and breakdown for list views"""
     
     # Overall score
     score = result['overall_score']
-    fit_level = result['fit_level']
+    skill_match = result['skill_match']
     
-    # Color based on score
-    if score >= 80:
-        color = "success"
-    elif score >= 60:
-        color = "warning"
-    else:
-        color = "error"
+    if compact:
+        st.progress(min(max(score / 100, 0.0), 1.0), text=f"Overall Score: {score:.1f}% ({result['fit_level']})")
+        st.markdown(
+            f"✅ **{skill_match['total_matched']} / {skill_match['total_required']}** required skills matched"
+            f" · ❌ **{len(skill_match['missing_skills'])}** missing"
+        )
+        return
     
-    col1, col2, col3, col4 = st.columns(4)
+    st.markdown("---")
+    st.markdown("## 📊 Match Results")
     
-    col1.metric("Overall Score", f"{score:.1f}%", fit_level)
-    col2.metric("Skill Match", f"{result['skill_match']['match_percentage']:.1f}%")
-    col3.metric("Text Similarity", f"{result['text_similarity']:.1f}%")
-    col4.metric("Semantic Similarity", f"{result['semantic_similarity']:.1f}%")
+    # Layout is created once up front; branches below only fill it
+    metric_cols = st.columns(4)
+    skill_col, missing_col = st.columns(2)
     
-    # Detailed breakdown
-    col1, col2 = st.columns(2)
+    metric_cols[0].metric("Overall Score", f"{score:.1f}%", result['fit_level'])
+    metric_cols[1].metric("Skill Match", f"{skill_match['match_percentage']:.1f}%")
+    metric_cols[2].metric("Text Similarity", f"{result['text_similarity']:.1f}%")
+    metric_cols[3].metric("Semantic Similarity", f"{result['semantic_similarity']:.1f}%")
     
-    with col1:
+    # Detailed breakdown
+    with skill_col:
         st.markdown("### ✅ Matched Skills")
-        skill_match = result['skill_match']
         
         st.info(f"**{skill_match['total_matched']} / {skill_match['total_required']}** required skills matched")
         
         if skill_match['matched_skills']:
-            for skill in skill_match['matched_skills']:
-                st.text(f"✓ {skill}")
+            st.text("\n".join(f"✓ {skill}" for skill in skill_match['matched_skills']))
     
-    with col2:
+    with missing_col:
         st.markdown("### ❌ Missing Skills")
         
         if skill_match['missing_skills']:
             st.warning(f"**{len(skill_match['missing_skills'])}** skills needed")
-            for skill in skill_match['missing_skills']:
-                st.text(f"✗ {skill}")
+            st.text("\n".join(f"✗ {skill}" for skill in skill_match['missing_skills']))
         else:
             st.success("No missing skills!")
     
@@ -657,30 +912,29 @@ def display_match_result(result):
         st.info(f"• {rec}")
     
     # Gauge chart
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number+delta",
-        value=score,
-        title={'text': "Overall Fit Score"},
-        delta={'reference': 70},
-        gauge={
-            'axis': {'range': [None, 100]},
-            'bar': {'color': "darkblue"},
-            'steps': [
-                {'range': [0, 40], 'color': "lightgray"},
-                {'range': [40, 60], 'color': "lightyellow"},
-                {'range': [60, 80], 'color': "lightgreen"},
-                {'range': [80, 100], 'color': "green"}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 70
-            }
-        }
-    ))
-    
-    fig.update_layout(height=300)
-    st.plotly_chart(fig, use_container_width=True)
+    _gauge(score)
+
+RANKING_COLUMNS = ['Rank', 'Candidate', 'Score', 'Fit Level', 'Skills Match', 'Missing Skills']
+
+@st.cache_data(show_spinner=False)
+def _rankings_df(matches_json):
+    """Build the rankings table for a batch result, keyed on its JSON encoding"""
+    matches = orjson.loads(matches_json)
+    
+    if not matches:
+        return pd.DataFrame(columns=RANKING_COLUMNS)
+    
+    df = pd.DataFrame(matches)
+    skill_match = pd.DataFrame(df['skill_match'].tolist())
+    
+    return pd.DataFrame({
+        'Rank': np.arange(1, len(df) + 1),
+        'Candidate': df['candidate_name'].fillna('').replace('', 'Unknown'),
+        'Score': df['overall_score'].map('{:.1f}%'.format),
+        'Fit Level': df['fit_level'],
+        'Skills Match': skill_match['match_percentage'].map('{:.1f}%'.format),
+        'Missing Skills': skill_match['missing_skills'].str.len()
+    }, columns=RANKING_COLUMNS)
 
 def display_batch_results(result):
     """Display batch match results"""
@@ -699,47 +953,44 @@ def display_batch_results(result):
     
     matches = result['matches']
     
-    # Create DataFrame
-    df_data = []
-    for i, match in enumerate(matches, 1):
-        df_data.append({
-            'Rank': i,
-            'Candidate': match['candidate_name'] or 'Unknown',
-            'Score': f"{match['overall_score']:.1f}%",
-            'Fit Level': match['fit_level'],
-            'Skills Match': f"{match['skill_match']['match_percentage']:.1f}%",
-            'Missing Skills': len(match['skill_match']['missing_skills'])
-        })
-    
-    df = pd.DataFrame(df_data)
+    # Create DataFrame (cached per distinct result set)
+    df = _rankings_df(orjson.dumps(matches, option=orjson.OPT_SORT_KEYS))
+    
+    # Only the current page is rendered so widget count stays O(page size)
+    num_pages = max(1, math.ceil(len(matches) / RESULTS_PAGE_SIZE))
+    page = 1
+    if num_pages > 1:
+        page = st.number_input(
+            f"Page (of {num_pages})",
+            min_value=1,
+            max_value=num_pages,
+            step=1,
+            key="batch_results_page"
+        )
+    start = (page - 1) * RESULTS_PAGE_SIZE
+    end = start + RESULTS_PAGE_SIZE
     
     # Style the dataframe
     st.dataframe(
-        df,
+        df.iloc[start:end],
         use_container_width=True,
         hide_index=True
     )
     
-    # Top 3 detailed view
-    st.markdown("### 🥇 Top 3 Candidates")
+    # Detailed view for the current page
+    st.markdown("### 🥇 Candidate Details")
     
-    for i, match in enumerate(matches[:3], 1):
+    for i, match in enumerate(matches[start:end], start + 1):
         with st.expander(f"#{i} - {match['candidate_name']} ({match['overall_score']:.1f}%)"):
-            display_match_result(match)
+            display_match_result(match, compact=True)
     
     # Score distribution
     st.markdown("### 📈 Score Distribution")
     
-    scores = [m['overall_score'] for m in matches]
-    
-    fig = px.histogram(
-        scores,
-        nbins=10,
-        title="Candidate Score Distribution",
-        labels={'value': 'Score', 'count': 'Number of Candidates'}
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    scores = tuple(m['overall_score'] for m in matches)
+    _score_hist(scores)
 
+@st.fragment
 def show_analytics():
     """Analytics and insights page"""
     
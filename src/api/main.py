@@ -4,83 +4,249 @@ FastAPI application for Resume Screening System
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
 from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from operator import itemgetter
+import multiprocessing
+import asyncio
+import heapq
+import anyio
+import orjson
+import hashlib
+import mmap
 import os
-import shutil
+import threading
 import time
 from datetime import datetime
 import sys
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path (once, even when re-imported by spawned workers)
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
 
 from api.schemas import (
     ResumeUploadResponse, JobDescriptionRequest, ProfileResponse,
     MatchResultResponse, BatchMatchRequest, BatchMatchResponse,
     HealthResponse, SkillsResponse, EducationResponse, SkillMatchResponse
 )
-from data_processing.pdf_parser import DocumentParser
+from data_processing.pdf_parser import DocumentParser, shutdown_pdf_executor
+from data_processing.batch_reader import read_files
 from data_processing.text_cleaner import TextCleaner
-from models.skill_extractor import SkillExtractor
-from models.matcher import ResumeJobMatcher
 
-# Global variables for models
+# Global variables for models (spaCy and the transformer are imported lazily
+# in _load_models, so the server starts and answers /health while they load)
 document_parser = None
 text_cleaner = None
 skill_extractor = None
 matcher = None
+model_load_error = None  # set if _load_models fails, so requests report why
 
 # Directories
 UPLOAD_DIR = "data/raw/uploaded_resumes"
 PROCESSED_DIR = "data/processed/uploaded_resumes"
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Load models on startup"""
-    global document_parser, text_cleaner, skill_extractor, matcher
+# Uploads are streamed to disk in chunks and capped in size
+UPLOAD_CHUNK_SIZE = 1 << 20
+MAX_UPLOAD_SIZE = 20 * (1 << 20)
+
+# Transformer dtype for semantic matching ('auto', 'fp16', 'bf16', 'int8' or 'fp32')
+MATCHER_PRECISION = os.getenv("MATCHER_PRECISION", "auto")
+
+# Files at least this large are memory-mapped instead of read when profiled
+MMAP_THRESHOLD = 1 << 20
+
+# Worker processes used to fan out /match/batch
+BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", os.cpu_count() or 1))
+
+# Resume profiles keyed by a hash of the file's content (LRU, shared by the
+# threadpool workers, so guarded by a lock)
+PROFILE_CACHE_SIZE = 1024
+profile_cache = OrderedDict()
+profile_cache_lock = threading.Lock()
+
+def _digest(data):
+    """blake2b content hash of a file's bytes, used as the profile cache key"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _cached_profile(digest):
+    """Cached profile for a content hash (marked recently used), or None"""
+    with profile_cache_lock:
+        profile = profile_cache.get(digest)
+        if profile is not None:
+            profile_cache.move_to_end(digest)
+        return profile
+
+def _cache_profile(digest, profile):
+    """Store a profile, evicting the least recently used beyond PROFILE_CACHE_SIZE"""
+    with profile_cache_lock:
+        profile_cache[digest] = profile
+        profile_cache.move_to_end(digest)
+        while len(profile_cache) > PROFILE_CACHE_SIZE:
+            profile_cache.popitem(last=False)
+
+def _extract_resume_profile(file_path, data):
+    """
+    Parse a resume and extract its complete profile
+    
+    Parameters:
+    -----------
+    file_path : str
+        Path to the resume file (selects the document format)
+    data : bytes-like
+        File contents, already read (or mapped) by the caller
+        
+    Returns:
+    --------
+    dict
+        Skill extractor profile plus name, years_experience, raw_text and contact
+    """
     
-    print("="*70)
-    print("STARTING RESUME SCREENING API")
-    print("="*70)
+    # Parse resume
+    doc_data = document_parser.parse_bytes(data, file_path)
+    resume_text = doc_data['text']
     
-    # Create directories
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    os.makedirs(PROCESSED_DIR, exist_ok=True)
+    # Extract profile
+    extracted = text_cleaner.extract_all(resume_text)
+    
+    resume_profile = skill_extractor.extract_complete_profile_cached(resume_text, extracted['sections'])
+    resume_profile['name'] = extracted['name']
+    resume_profile['years_experience'] = extracted['years_experience']
+    resume_profile['raw_text'] = resume_text
+    resume_profile['contact'] = extracted['contact']
+    
+    return resume_profile
+
+def _build_resume_profile(file_path):
+    """Resume profile for a file, served from the content-hash cache when possible"""
+    with open(file_path, 'rb') as f:
+        # Large files are mapped rather than copied into memory; hashing and
+        # PDF parsing both read straight from the page cache
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+    
+    try:
+        digest = _digest(data)
+        
+        resume_profile = _cached_profile(digest)
+        if resume_profile is None:
+            resume_profile = _extract_resume_profile(file_path, data)
+            _cache_profile(digest, resume_profile)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+    
+    return resume_profile
+
+def _index_entry(filename, file_stats):
+    """Listing entry for an uploaded resume"""
+    return {
+        "filename": filename,
+        "size_bytes": file_stats.st_size,
+        "size_kb": round(file_stats.st_size / 1024, 2),
+        "uploaded_at": datetime.fromtimestamp(file_stats.st_ctime).isoformat()
+    }
+
+def _scan_resumes():
+    """Build the resume index from a single scan of UPLOAD_DIR"""
+    with os.scandir(UPLOAD_DIR) as entries:
+        return {
+            entry.name: _index_entry(entry.name, entry.stat())
+            for entry in entries if entry.is_file()
+        }
+
+def _init_worker():
+    """Load the extraction models once per batch worker process"""
+    global document_parser, text_cleaner, skill_extractor
+    from models.skill_extractor import SkillExtractor
+    
+    document_parser = DocumentParser()
+    text_cleaner = TextCleaner()
+    skill_extractor = SkillExtractor(use_large_model=False)
+
+def _load_models():
+    """Import and load the models (run in a thread, off the event loop)"""
+    global document_parser, text_cleaner, skill_extractor, matcher, model_load_error
     
-    # Initialize models
     print("\n📦 Loading models...")
     try:
+        from models.skill_extractor import SkillExtractor
+        from models.matcher import ResumeJobMatcher
+        
         document_parser = DocumentParser()
-        print("  ✓ Document parser loaded")
+        print(f"  ✓ Document parser loaded (PDF backend: {document_parser.pdf_backend})")
         
         text_cleaner = TextCleaner()
-        print("  ✓ Text cleaner loaded")
+        print(f"  ✓ Text cleaner loaded (contact regex: {text_cleaner.regex_backend})")
         
         skill_extractor = SkillExtractor(use_large_model=False)
         print("  ✓ Skill extractor loaded")
         
-        matcher = ResumeJobMatcher(use_transformers=True)
+        matcher = ResumeJobMatcher(use_transformers=True, precision=MATCHER_PRECISION)
         print("  ✓ Resume matcher loaded")
         
         print("\n✓ All models loaded successfully!")
         print("="*70)
     except Exception as e:
+        model_load_error = e
         print(f"\n❌ Error loading models: {e}")
-        raise
+
+def _require_models():
+    """Reject requests that need the models until they have loaded (or say why they failed to)"""
+    if model_load_error is not None:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Model loading failed: {type(model_load_error).__name__}: {model_load_error}"
+        )
+    if matcher is None:
+        raise HTTPException(status_code=503, detail="Models are still loading, please retry shortly")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start loading models in the background and set up shared state"""
+    
+    print("="*70)
+    print("STARTING RESUME SCREENING API")
+    print("="*70)
+    
+    # Create directories
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    os.makedirs(PROCESSED_DIR, exist_ok=True)
+    
+    # Index uploaded resumes once; upload and delete keep it current
+    app.state.resume_index = _scan_resumes()
+    
+    # Spawned (not forked) so workers never inherit the parent's torch threads
+    app.state.pool = ProcessPoolExecutor(
+        max_workers=BATCH_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker
+    )
+    print(f"\n⚙ Batch worker pool ready ({BATCH_WORKERS} workers)")
+    
+    # Load models without blocking startup; model endpoints return 503 until done
+    app.state.model_loader = asyncio.create_task(asyncio.to_thread(_load_models))
     
     yield
     
-    # Cleanup (if needed)
+    # Cleanup
     print("\n🔴 Shutting down API...")
+    app.state.pool.shutdown(cancel_futures=True)
+    shutdown_pdf_executor()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Resume Screening System API",
     description="AI-powered Applicant Tracking System for resume screening and candidate matching",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -94,13 +260,38 @@ app.add_middleware(
 
 # Helper functions
 
-def save_upload_file(upload_file: UploadFile, destination: str):
-    """Save uploaded file to destination"""
+def _safe_path(filename: str) -> str:
+    """
+    Path of an uploaded resume, rejecting names that could escape UPLOAD_DIR
+    
+    Only plain file names are accepted, so no separators, '..' or NUL
+    bytes. The check is pure string work with no filesystem calls; missing
+    files surface as FileNotFoundError when the file is actually opened.
+    """
+    if (not filename or filename in ('.', '..') or '\0' in filename or '\\' in filename
+            or os.path.basename(filename) != filename):
+        raise HTTPException(status_code=400, detail=f"Invalid filename: {filename!r}")
+    
+    return os.path.join(UPLOAD_DIR, filename)
+
+async def save_upload_file(upload_file: UploadFile, destination: str):
+    """Stream uploaded file to destination in chunks without blocking the event loop"""
+    size = 0
     try:
-        with open(destination, "wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
+        async with await anyio.open_file(destination, "wb") as buffer:
+            while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1 << 20)} MB"
+                    )
+                await buffer.write(chunk)
+    except HTTPException:
+        os.remove(destination)
+        raise
     finally:
-        upload_file.file.close()
+        await upload_file.close()
 
 def generate_recommendations(match_result: dict) -> List[str]:
     """Generate recommendations based on match result"""
@@ -184,17 +375,21 @@ async def upload_resume(file: UploadFile = File(...)):
             detail=f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
         )
     
+    _require_models()
+    
     # Save file
-    file_path = os.path.join(UPLOAD_DIR, file.filename)
-    save_upload_file(file, file_path)
+    file_path = _safe_path(file.filename)
+    await save_upload_file(file, file_path)
     
-    # Get file size
-    file_size = os.path.getsize(file_path)
+    # Get file size and record the upload in the index
+    file_stats = os.stat(file_path)
+    file_size = file_stats.st_size
+    app.state.resume_index[file.filename] = _index_entry(file.filename, file_stats)
     
-    # Extract text
+    # Extract text and profile it now, so later profile/match calls hit the cache
     try:
-        doc_data = document_parser.parse_file(file_path)
-        text_length = len(doc_data['text'])
+        resume_profile = await run_in_threadpool(_build_resume_profile, file_path)
+        text_length = len(resume_profile['raw_text'])
         status = "success"
         message = "Resume uploaded and processed successfully"
     except Exception as e:
@@ -211,46 +406,37 @@ async def upload_resume(file: UploadFile = File(...)):
     )
 
 @app.get("/resume/profile/{filename}", response_model=ProfileResponse, tags=["Resume"])
-async def extract_profile(filename: str):
+def extract_profile(filename: str):
     """
     Extract complete profile from an uploaded resume
     
     - **filename**: Name of the uploaded resume file
     """
     
-    file_path = os.path.join(UPLOAD_DIR, filename)
-    
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="Resume file not found")
+    _require_models()
+    file_path = _safe_path(filename)
     
     try:
-        # Parse document
-        doc_data = document_parser.parse_file(file_path)
-        text = doc_data['text']
-        
-        # Extract contact info
-        contact = text_cleaner.extract_contact_info(text)
-        name = text_cleaner.extract_name(text)
-        years_exp = text_cleaner.extract_years_of_experience(text)
-        sections = text_cleaner.extract_sections(text)
-        
         # Extract complete profile
-        profile = skill_extractor.extract_complete_profile(text, sections)
+        profile = _build_resume_profile(file_path)
+        contact = profile['contact']
         
         return ProfileResponse(
             filename=filename,
-            name=name,
+            name=profile['name'],
             email=contact['email'],
             phone=contact['phone'],
             linkedin=contact['linkedin'],
             github=contact['github'],
-            years_experience=years_exp,
+            years_experience=profile['years_experience'],
             skills=SkillsResponse(**profile['skills']),
             education=EducationResponse(**profile['education']),
             experience_level=profile['experience_level'],
             certifications=profile['certifications']
         )
         
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Resume file not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error extracting profile: {str(e)}")
 
@@ -266,61 +452,136 @@ async def match_single_resume(
     - **job_description**: Job description details
     """
     
-    file_path = os.path.join(UPLOAD_DIR, filename)
-    
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="Resume file not found")
+    _require_models()
+    file_path = _safe_path(filename)
     
     try:
-        # Parse resume
-        doc_data = document_parser.parse_file(file_path)
-        resume_text = doc_data['text']
-        
-        # Extract resume profile
-        contact = text_cleaner.extract_contact_info(resume_text)
-        name = text_cleaner.extract_name(resume_text)
-        years_exp = text_cleaner.extract_years_of_experience(resume_text)
-        sections = text_cleaner.extract_sections(resume_text)
-        
-        resume_profile = skill_extractor.extract_complete_profile(resume_text, sections)
-        resume_profile['filename'] = filename
-        resume_profile['name'] = name
-        resume_profile['years_experience'] = years_exp
-        resume_profile['raw_text'] = resume_text
-        
-        # Extract job profile
-        job_profile = skill_extractor.extract_complete_profile(
-            job_description.description,
-            {}
+        # The resume and job profiles are independent, so extract them side
+        # by side (the job encoding releases the GIL inside torch)
+        resume_profile, prepared_job = await asyncio.gather(
+            run_in_threadpool(_build_resume_profile, file_path),
+            run_in_threadpool(_prepare_job, job_description)
         )
-        job_profile['raw_text'] = job_description.description
-        
-        # Override with specified requirements
-        if job_description.required_skills:
-            job_profile['skills']['skills'] = job_description.required_skills
         
         # Calculate match
-        match_result = matcher.calculate_overall_fit_score(resume_profile, job_profile)
-        
-        # Generate recommendations
-        recommendations = generate_recommendations(match_result)
-        
-        return MatchResultResponse(
-            candidate_name=name,
-            filename=filename,
-            overall_score=match_result['overall_score'],
-            fit_level=match_result['fit_level'],
-            skill_match=SkillMatchResponse(**match_result['skill_match']),
-            experience_match=match_result['experience_match'],
-            education_match=match_result['education_match'],
-            text_similarity=match_result['text_similarity'],
-            semantic_similarity=match_result['semantic_similarity'],
-            recommendations=recommendations
+        match, = await run_in_threadpool(
+            _score_batch, [dict(resume_profile, filename=filename)], prepared_job
         )
         
+        return MatchResultResponse(**match)
+        
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Resume file not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error matching resume: {str(e)}")
 
+def _prepare_job(job_description: JobDescriptionRequest) -> dict:
+    """Extract the job profile and encode it for scoring"""
+    job_profile = skill_extractor.extract_complete_profile_cached(
+        job_description.description,
+        {}
+    )
+    job_profile['raw_text'] = job_description.description
+    
+    if job_description.required_skills:
+        job_profile['skills']['skills'] = job_description.required_skills
+    
+    return matcher.prepare_job(job_profile)
+
+def _score_batch(profiles: List[dict], prepared_job: dict) -> List[dict]:
+    """Score resume profiles against a prepared job, as plain match dicts"""
+    # Phases 2 and 3: one batched transformer pass, then fit scores
+    try:
+        scored = list(zip(profiles, matcher.batch_score(profiles, prepared_job)))
+    except Exception as e:
+        if len(profiles) == 1:
+            raise
+        
+        # One bad resume must not sink the whole batch: score them one at a
+        # time and skip the ones that fail
+        print(f"Batch scoring failed ({e}), scoring resumes one at a time")
+        scored = []
+        for resume_profile in profiles:
+            try:
+                scored.append((resume_profile, matcher.score_against(resume_profile, prepared_job)))
+            except Exception as e:
+                print(f"Error processing {resume_profile['filename']}: {e}")
+    
+    matches = []
+    
+    for resume_profile, match_result in scored:
+        matches.append({
+            'candidate_name': resume_profile['name'],
+            'filename': resume_profile['filename'],
+            'overall_score': match_result['overall_score'],
+            'fit_level': match_result['fit_level'],
+            'skill_match': match_result['skill_match'],
+            'experience_match': match_result['experience_match'],
+            'education_match': match_result['education_match'],
+            'text_similarity': match_result['text_similarity'],
+            'semantic_similarity': match_result['semantic_similarity'],
+            'recommendations': generate_recommendations(match_result)
+        })
+    
+    return matches
+
+def _match_response(match: dict) -> MatchResultResponse:
+    """Build a match model from a _score_batch dict without re-validating it"""
+    return MatchResultResponse.model_construct(
+        **dict(match, skill_match=SkillMatchResponse.model_construct(**match['skill_match']))
+    )
+
+def _batch_filenames(request: BatchMatchRequest) -> List[str]:
+    """Resumes named in a batch request, or every indexed resume"""
+    if request.resume_filenames:
+        resume_files = request.resume_filenames
+        
+        # Reject bad names up front, before any extraction work starts
+        for filename in resume_files:
+            _safe_path(filename)
+    else:
+        # Get all indexed resumes
+        resume_files = list(app.state.resume_index)
+    
+    if not resume_files:
+        raise HTTPException(status_code=404, detail="No resume files found")
+    
+    return resume_files
+
+async def _start_profile_tasks(resume_files: List[str]) -> list:
+    """
+    Read resumes and start extracting their profiles
+    
+    All files are read concurrently up front; cached profiles are looked up
+    by content hash and the worker pool extracts the rest. Unreadable files
+    are skipped.
+    
+    Returns:
+    --------
+    list
+        (filename, digest, awaitable profile) tuples
+    """
+    
+    loop = asyncio.get_running_loop()
+    file_paths = [_safe_path(filename) for filename in resume_files]
+    contents = await loop.run_in_executor(None, read_files, file_paths)
+    pending = []
+    
+    for filename, file_path in zip(resume_files, file_paths):
+        data = contents[file_path]
+        if isinstance(data, OSError):
+            continue
+        
+        digest = _digest(data)
+        cached = _cached_profile(digest)
+        if cached is not None:
+            task = asyncio.ensure_future(asyncio.sleep(0, result=cached))
+        else:
+            task = loop.run_in_executor(app.state.pool, _extract_resume_profile, file_path, data)
+        pending.append((filename, digest, task))
+    
+    return pending
+
 @app.post("/match/batch", response_model=BatchMatchResponse, tags=["Matching"])
 async def match_batch_resumes(request: BatchMatchRequest):
     """
@@ -330,110 +591,123 @@ async def match_batch_resumes(request: BatchMatchRequest):
     - **resume_filenames**: List of resume filenames (optional, if not provided, matches all)
     """
     
+    _require_models()
     start_time = time.time()
     
-    # Get list of resumes to process
-    if request.resume_filenames:
-        resume_files = request.resume_filenames
-    else:
-        # Get all resumes in upload directory
-        resume_files = [f for f in os.listdir(UPLOAD_DIR) 
-                       if os.path.isfile(os.path.join(UPLOAD_DIR, f))]
+    resume_files = _batch_filenames(request)
     
-    if not resume_files:
-        raise HTTPException(status_code=404, detail="No resume files found")
+    # Extract and encode the job once for the whole batch
+    prepared_job = await run_in_threadpool(_prepare_job, request.job_description)
     
-    # Extract job profile
-    job_profile = skill_extractor.extract_complete_profile(
-        request.job_description.description,
-        {}
-    )
-    job_profile['raw_text'] = request.job_description.description
+    # Phase 1: profiles, from the cache or the worker pool
+    pending = await _start_profile_tasks(resume_files)
+    results = await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
     
-    if request.job_description.required_skills:
-        job_profile['skills']['skills'] = request.job_description.required_skills
+    profiles = []
     
-    # Match each resume
-    matches = []
-    
-    for filename in resume_files:
-        file_path = os.path.join(UPLOAD_DIR, filename)
-        
-        if not os.path.exists(file_path):
+    for (filename, digest, _), result in zip(pending, results):
+        if isinstance(result, Exception):
+            print(f"Error processing {filename}: {result}")
             continue
         
-        try:
-            # Parse resume
-            doc_data = document_parser.parse_file(file_path)
-            resume_text = doc_data['text']
-            
-            # Extract profile
-            contact = text_cleaner.extract_contact_info(resume_text)
-            name = text_cleaner.extract_name(resume_text)
-            years_exp = text_cleaner.extract_years_of_experience(resume_text)
-            sections = text_cleaner.extract_sections(resume_text)
-            
-            resume_profile = skill_extractor.extract_complete_profile(resume_text, sections)
-            resume_profile['filename'] = filename
-            resume_profile['name'] = name
-            resume_profile['years_experience'] = years_exp
-            resume_profile['raw_text'] = resume_text
-            
-            # Calculate match
-            match_result = matcher.calculate_overall_fit_score(resume_profile, job_profile)
-            
-            # Generate recommendations
-            recommendations = generate_recommendations(match_result)
-            
-            matches.append(MatchResultResponse(
-                candidate_name=name,
-                filename=filename,
-                overall_score=match_result['overall_score'],
-                fit_level=match_result['fit_level'],
-                skill_match=SkillMatchResponse(**match_result['skill_match']),
-                experience_match=match_result['experience_match'],
-                education_match=match_result['education_match'],
-                text_similarity=match_result['text_similarity'],
-                semantic_similarity=match_result['semantic_similarity'],
-                recommendations=recommendations
-            ))
-            
-        except Exception as e:
-            print(f"Error processing {filename}: {e}")
-            continue
+        _cache_profile(digest, result)
+        profiles.append(dict(result, filename=filename))
     
-    # Sort by overall score
-    matches.sort(key=lambda x: x.overall_score, reverse=True)
+    # Phases 2 and 3: batched encoding and fit scores, off the event loop
+    matches = await run_in_threadpool(_score_batch, profiles, prepared_job)
+    
+    # Rank the plain dicts by overall score (a heap when only the top_k are
+    # wanted); only the returned window becomes models
+    if request.top_k:
+        top_matches = heapq.nlargest(request.top_k, matches, key=itemgetter('overall_score'))
+    else:
+        top_matches = sorted(matches, key=itemgetter('overall_score'), reverse=True)
     
     processing_time = time.time() - start_time
     
     return BatchMatchResponse(
         job_title=request.job_description.title,
         total_candidates=len(matches),
-        matches=matches,
+        matches=[_match_response(m) for m in top_matches],
         processing_time=round(processing_time, 2)
     )
 
+@app.post("/match/batch/stream", tags=["Matching"])
+async def stream_batch_matches(request: BatchMatchRequest):
+    """
+    Match multiple resumes to a job description, streamed as Server-Sent Events
+    
+    Each match is sent as a `data:` event as soon as its resume is scored;
+    a final `done` event carries the ranking and processing time. Resumes are
+    encoded one at a time rather than in one batch, trading some throughput
+    for time-to-first-result. Disconnecting cancels the remaining work.
+    
+    - **job_description**: Job description details
+    - **resume_filenames**: List of resume filenames (optional, if not provided, matches all)
+    """
+    
+    _require_models()
+    start_time = time.time()
+    
+    resume_files = _batch_filenames(request)
+    prepared_job = await run_in_threadpool(_prepare_job, request.job_description)
+    pending = await _start_profile_tasks(resume_files)
+    
+    async def profile_of(filename, digest, task):
+        try:
+            return filename, digest, await task
+        except Exception as e:
+            return filename, digest, e
+    
+    async def events():
+        ranking = []
+        total_candidates = 0
+        try:
+            for next_done in asyncio.as_completed([profile_of(*p) for p in pending]):
+                filename, digest, result = await next_done
+                if isinstance(result, Exception):
+                    print(f"Error processing {filename}: {result}")
+                    continue
+                
+                _cache_profile(digest, result)
+                try:
+                    match, = await run_in_threadpool(
+                        _score_batch, [dict(result, filename=filename)], prepared_job
+                    )
+                except Exception as e:
+                    print(f"Error processing {filename}: {e}")
+                    continue
+                total_candidates += 1
+                ranking.append({
+                    'filename': match['filename'],
+                    'candidate_name': match['candidate_name'],
+                    'overall_score': match['overall_score']
+                })
+                yield b"data: " + orjson.dumps(match, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n\n"
+            
+            if request.top_k:
+                ranking = heapq.nlargest(request.top_k, ranking, key=itemgetter('overall_score'))
+            else:
+                ranking.sort(key=itemgetter('overall_score'), reverse=True)
+            summary = {
+                'job_title': request.job_description.title,
+                'total_candidates': total_candidates,
+                'ranking': ranking,
+                'processing_time': round(time.time() - start_time, 2)
+            }
+            yield b"event: done\ndata: " + orjson.dumps(summary, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n\n"
+        finally:
+            # Client went away: drop queued extractions
+            for _, _, task in pending:
+                task.cancel()
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 @app.get("/resumes/list", tags=["Resume"])
 async def list_resumes():
     """List all uploaded resumes"""
     
-    if not os.path.exists(UPLOAD_DIR):
-        return {"resumes": [], "total": 0}
-    
-    resumes = []
-    
-    for filename in os.listdir(UPLOAD_DIR):
-        file_path = os.path.join(UPLOAD_DIR, filename)
-        
-        if os.path.isfile(file_path):
-            file_stats = os.stat(file_path)
-            resumes.append({
-                "filename": filename,
-                "size_bytes": file_stats.st_size,
-                "size_kb": round(file_stats.st_size / 1024, 2),
-                "uploaded_at": datetime.fromtimestamp(file_stats.st_ctime).isoformat()
-            })
+    resumes = list(app.state.resume_index.values())
     
     return {
         "resumes": resumes,
@@ -444,14 +718,14 @@ async def list_resumes():
 async def delete_resume(filename: str):
     """Delete an uploaded resume"""
     
-    file_path = os.path.join(UPLOAD_DIR, filename)
-    
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="Resume file not found")
+    file_path = _safe_path(filename)
     
     try:
         os.remove(file_path)
+        app.state.resume_index.pop(filename, None)
         return {"message": f"Resume {filename} deleted successfully"}
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Resume file not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting file: {str(e)}")
 
@@ -2,14 +2,18 @@
 FastAPI application with Database Integration
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from contextlib import asynccontextmanager
 from typing import List, Optional
+import asyncio
 import os
-import shutil
 import time
+import anyio
+import orjson
 from datetime import datetime
 import sys
 import numpy as np
@@ -21,12 +25,13 @@ from api.schemas import (
     MatchResultResponse, BatchMatchRequest, BatchMatchResponse,
     HealthResponse, SkillsResponse, EducationResponse, SkillMatchResponse
 )
-from data_processing.pdf_parser import DocumentParser
+from data_processing.pdf_parser import DocumentParser, shutdown_pdf_executor
 from data_processing.text_cleaner import TextCleaner
 from models.skill_extractor import SkillExtractor
 from models.matcher import ResumeJobMatcher
-from database.database import get_db, engine
-from database.models import Base, Resume as ResumeModel, JobDescription as JobModel, Match as MatchModel
+from models.skill_database import get_skill_category
+from database.database import get_db, engine, SessionLocal
+from database.models import Base, Resume as ResumeModel, JobDescription as JobModel, Match as MatchModel, generate_uuid
 from database import crud
 
 # Global variables for models
@@ -39,6 +44,23 @@ matcher = None
 UPLOAD_DIR = "data/raw/uploaded_resumes"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Uploads are read in chunks and capped in size
+UPLOAD_CHUNK_SIZE = 1 << 20
+MAX_UPLOAD_SIZE = 20 * (1 << 20)
+
+# Transformer dtype for semantic matching ('auto', 'fp16', 'bf16', 'int8' or 'fp32')
+MATCHER_PRECISION = os.getenv("MATCHER_PRECISION", "auto")
+
+# Resumes matching fewer than this percentage of a job's skills skip the
+# text and semantic similarity (scored as 0); 0 scores every resume fully
+MIN_SKILL_MATCH = float(os.getenv("MIN_SKILL_MATCH", "0"))
+
+# Status of uploads processed in the background, keyed by resume ID. Stored
+# uploads are dropped (the status endpoint reads them from the database);
+# failed ones are kept, oldest dropped past UPLOAD_ERRORS_MAX
+upload_status = {}
+UPLOAD_ERRORS_MAX = 1024
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Load models and initialize database on startup"""
@@ -57,15 +79,15 @@ async def lifespan(app: FastAPI):
     print("\n📦 Loading ML models...")
     try:
         document_parser = DocumentParser()
-        print("  ✓ Document parser loaded")
+        print(f"  ✓ Document parser loaded (PDF backend: {document_parser.pdf_backend})")
         
         text_cleaner = TextCleaner()
-        print("  ✓ Text cleaner loaded")
+        print(f"  ✓ Text cleaner loaded (contact regex: {text_cleaner.regex_backend})")
         
         skill_extractor = SkillExtractor(use_large_model=False)
         print("  ✓ Skill extractor loaded")
         
-        matcher = ResumeJobMatcher(use_transformers=True)
+        matcher = ResumeJobMatcher(use_transformers=True, precision=MATCHER_PRECISION)
         print("  ✓ Resume matcher loaded")
         
         print("\n✓ All models loaded successfully!")
@@ -77,6 +99,7 @@ async def lifespan(app: FastAPI):
     yield
     
     print("\n🔴 Shutting down API...")
+    shutdown_pdf_executor()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -97,13 +120,230 @@ app.add_middleware(
 
 # Helper functions
 
-def save_upload_file(upload_file: UploadFile, destination: str):
-    """Save uploaded file to destination"""
+async def read_upload_file(upload_file: UploadFile) -> bytes:
+    """Read an uploaded file into memory in chunks, up to MAX_UPLOAD_SIZE (parsed from there, written to disk once)"""
+    chunks = []
+    size = 0
     try:
-        with open(destination, "wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
+        while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_UPLOAD_SIZE:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1 << 20)} MB"
+                )
+            chunks.append(chunk)
+        return b"".join(chunks)
     finally:
-        upload_file.file.close()
+        await upload_file.close()
+
+def _filename_in_use(db: Session, filename: str) -> bool:
+    """Whether a resume with this filename is stored or still being processed"""
+    if crud.resume_filename_exists(db, filename):
+        return True
+    return any(
+        entry["status"] == "queued" and entry["filename"] == filename
+        for entry in upload_status.values()
+    )
+
+def _reserve_filename(db: Session, filename: str) -> Optional[str]:
+    """
+    Claim a filename for a new upload, returning its resume ID (None if taken)
+    
+    Nothing here awaits, so no other request can pass the check and claim the
+    same name before the queued entry exists.
+    """
+    if _filename_in_use(db, filename):
+        return None
+    resume_id = generate_uuid()
+    upload_status[resume_id] = {"status": "queued", "filename": filename}
+    return resume_id
+
+def _release_filename(resume_id: str):
+    """Drop a reservation that did not end in a stored resume or a reported error"""
+    if upload_status.get(resume_id, {}).get("status") == "queued":
+        del upload_status[resume_id]
+
+def _partial_path(file_path: str, resume_id: str) -> str:
+    """Where an upload is written until its row is stored (unique to that upload)"""
+    return f"{file_path}.{resume_id}.part"
+
+def _upload_failed(resume_id: str, filename: str, message: str):
+    """Record a failed upload for the status endpoint, keeping the newest UPLOAD_ERRORS_MAX"""
+    upload_status.pop(resume_id, None)
+    upload_status[resume_id] = {"status": "error", "filename": filename, "message": message}
+    
+    errors = [rid for rid, entry in upload_status.items() if entry["status"] == "error"]
+    for rid in errors[:-UPLOAD_ERRORS_MAX]:
+        del upload_status[rid]
+
+def _stored_profile(profile: dict) -> dict:
+    """Extracted profile as saved on the resume row (without bulky match positions)"""
+    return {
+        'skills': {k: v for k, v in profile['skills'].items() if k != 'skill_positions'},
+        'education': profile['education'],
+        'experience_level': profile['experience_level'],
+        'certifications': profile['certifications']
+    }
+
+def _resume_profile(resume: ResumeModel) -> dict:
+    """Profile of a stored resume, built from its columns (the skill extractor never runs)"""
+    if resume.profile:
+        return dict(resume.profile)
+    
+    # Rows saved before profiles were persisted: rebuild from the flat columns
+    skills = resume.skills or []
+    categories = {}
+    for skill in skills:
+        categories.setdefault(get_skill_category(skill), []).append(skill)
+    
+    return {
+        'skills': {
+            'skills': skills,
+            'total_skills': len(skills),
+            'categories': categories,
+            'skill_count': {}
+        },
+        'education': {
+            'highest_level': resume.education_level,
+            'has_degree': resume.education_level is not None,
+            'found_degrees': []
+        },
+        'experience_level': resume.experience_level,
+        'certifications': resume.certifications or []
+    }
+
+def _prepare_job(job: JobModel) -> dict:
+    """Extract a stored job's profile and prepare it for scoring, reusing its saved embedding"""
+    job_profile = skill_extractor.extract_complete_profile_cached(job.description, {})
+    job_profile['raw_text'] = job.description
+    if job.required_skills:
+        job_profile['skills']['skills'] = job.required_skills
+    
+    embedding = None
+    if job.embedding_fp16:
+        embedding = np.frombuffer(job.embedding_fp16, dtype=np.float16)
+    
+    return matcher.prepare_job(job_profile, embedding=embedding)
+
+def _match_input(resume: ResumeModel) -> dict:
+    """Resume profile in the shape the matcher expects"""
+    resume_profile = _resume_profile(resume)
+    resume_profile['filename'] = resume.filename
+    resume_profile['name'] = resume.candidate_name
+    resume_profile['years_experience'] = resume.years_experience
+    resume_profile['raw_text'] = resume.raw_text
+    return resume_profile
+
+def _recommendations(match_result: dict) -> List[str]:
+    """Short hiring recommendations for a match result"""
+    recommendations = []
+    if match_result['overall_score'] >= 80:
+        recommendations.append("Excellent fit - Highly recommended for interview")
+    elif match_result['overall_score'] >= 60:
+        recommendations.append("Good fit - Recommend for initial screening")
+    
+    missing_skills = match_result['skill_match']['missing_skills']
+    if missing_skills and len(missing_skills) <= 3:
+        recommendations.append(f"Consider acquiring: {', '.join(missing_skills[:3])}")
+    
+    return recommendations
+
+def _match_data(resume_id: str, job_id: str, match_result: dict, recommendations: List[str]) -> dict:
+    """Match row for the database (JSON columns take numpy values as-is, see database.py)"""
+    return {
+        "resume_id": resume_id,
+        "job_id": job_id,
+        "overall_score": float(match_result['overall_score']),
+        "skill_match_percentage": float(match_result['skill_match']['match_percentage']),
+        "text_similarity": float(match_result['text_similarity']),
+        "semantic_similarity": float(match_result['semantic_similarity']),
+        "fit_level": match_result['fit_level'],
+        "skill_match_details": match_result['skill_match'],
+        "experience_match": match_result['experience_match'],
+        "education_match": match_result['education_match'],
+        "recommendations": recommendations
+    }
+
+def _match_response(resume: ResumeModel, match_result: dict, recommendations: List[str]) -> MatchResultResponse:
+    """API response for a match result"""
+    return MatchResultResponse(
+        candidate_name=resume.candidate_name,
+        filename=resume.filename,
+        overall_score=match_result['overall_score'],
+        fit_level=match_result['fit_level'],
+        skill_match=SkillMatchResponse(**match_result['skill_match']),
+        experience_match=match_result['experience_match'],
+        education_match=match_result['education_match'],
+        text_similarity=match_result['text_similarity'],
+        semantic_similarity=match_result['semantic_similarity'],
+        recommendations=recommendations
+    )
+
+def _resume_row(resume_id: str, filename: str, file_ext: str, file_size: int,
+                text: str, extracted: dict, profile: dict, embedding) -> dict:
+    """Resume row from the output of each processing stage"""
+    contact = extracted['contact']
+    
+    return {
+        "id": resume_id,
+        "filename": filename,
+        "original_filename": filename,
+        "file_size": file_size,
+        "file_type": file_ext[1:],
+        "candidate_name": extracted['name'],
+        "email": contact.get('email'),
+        "phone": contact.get('phone'),
+        "linkedin": contact.get('linkedin'),
+        "github": contact.get('github'),
+        "raw_text": text,
+        "years_experience": extracted['years_experience'],
+        "experience_level": profile['experience_level'],
+        "education_level": profile['education']['highest_level'],
+        "skills": profile['skills']['skills'],
+        "certifications": profile['certifications'],
+        "profile": _stored_profile(profile),
+        "embedding_fp16": embedding.astype(np.float16).tobytes() if embedding is not None else None
+    }
+
+def _resume_record(resume_id: str, data: bytes, filename: str, file_ext: str) -> dict:
+    """Parse and profile an uploaded resume's contents into a Resume row"""
+    
+    # Parse document straight from the upload's bytes
+    text = document_parser.parse_bytes(data, filename)['text']
+    
+    # Extract profile
+    extracted = text_cleaner.extract_all(text)
+    profile = skill_extractor.extract_complete_profile_cached(text, extracted['sections'])
+    embedding = matcher.encode_text(text)
+    
+    return _resume_row(resume_id, filename, file_ext, len(data), text, extracted, profile, embedding)
+
+def process_resume(resume_id: str, data: bytes, file_path: str, filename: str, file_ext: str):
+    """Parse, profile and store an uploaded resume (runs after the upload has been answered)"""
+    db = SessionLocal()
+    partial_path = _partial_path(file_path, resume_id)
+    
+    try:
+        resume_data = _resume_record(resume_id, data, filename, file_ext)
+        
+        # Only resumes that parsed are kept on disk, moved into place once
+        # the row (and so the filename) is stored
+        with open(partial_path, "wb") as f:
+            f.write(data)
+        
+        # Save to database; from here on its status comes from the row
+        crud.create_resume(db, resume_data)
+        os.replace(partial_path, file_path)
+        upload_status.pop(resume_id, None)
+        
+    except Exception as e:
+        # Clean up this upload's file if processing or the database save fails
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        _upload_failed(resume_id, filename, f"Error processing resume: {str(e)}")
+    finally:
+        db.close()
 
 # API Endpoints
 
@@ -118,12 +358,16 @@ async def root():
         "endpoints": {
             "health": "/health",
             "upload_resume": "/resume/upload",
+            "upload_stream": "/resume/upload/stream",
+            "upload_batch": "/resume/upload_batch",
+            "upload_status": "/resume/{resume_id}/status",
             "get_resume": "/resume/{resume_id}",
             "list_resumes": "/resumes",
             "create_job": "/job/create",
             "list_jobs": "/jobs",
             "match_single": "/match/{resume_id}/{job_id}",
-            "match_batch": "/match/batch/{job_id}"
+            "match_batch": "/match/batch/{job_id}",
+            "match_topk": "/match/topk/{job_id}?k=50"
         },
         "documentation": "/docs"
     }
@@ -146,12 +390,13 @@ async def health_check(db: Session = Depends(get_db)):
         version="2.0.0"
     )
 
-@app.post("/resume/upload", response_model=ResumeUploadResponse, tags=["Resume"])
+@app.post("/resume/upload", response_model=ResumeUploadResponse, status_code=202, tags=["Resume"])
 async def upload_resume(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db)
 ):
-    """Upload and process a resume"""
+    """Upload a resume and queue it for processing"""
     
     # Validate file type
     allowed_extensions = ['.pdf', '.docx', '.txt']
@@ -163,66 +408,250 @@ async def upload_resume(
             detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
         )
     
-    # Check if resume already exists
-    existing = crud.get_resume_by_filename(db, file.filename)
-    if existing:
+    # Check if resume already exists (stored, or still being processed) and
+    # claim the name before anything awaits
+    resume_id = _reserve_filename(db, file.filename)
+    if resume_id is None:
         raise HTTPException(
             status_code=400,
             detail=f"Resume with filename '{file.filename}' already exists"
         )
     
-    # Save file
+    # Read the upload once; it is parsed from memory and written to disk
+    # by the background task
+    try:
+        data = await read_upload_file(file)
+    except BaseException:
+        _release_filename(resume_id)
+        raise
     file_path = os.path.join(UPLOAD_DIR, file.filename)
-    save_upload_file(file, file_path)
-    file_size = os.path.getsize(file_path)
     
+    # Parsing and profiling run in the background; poll the status endpoint
+    background_tasks.add_task(process_resume, resume_id, data, file_path, file.filename, file_ext)
+    
+    return ResumeUploadResponse(
+        filename=file.filename,
+        file_size=len(data),
+        extracted_text_length=0,
+        processing_status="queued",
+        message=f"Resume queued for processing (ID: {resume_id})",
+        resume_id=resume_id
+    )
+
+@app.post("/resume/upload/stream", tags=["Resume"])
+async def upload_resume_stream(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload and process a resume, streaming progress as Server-Sent Events
+    
+    A `data:` event is sent as each stage finishes (parsed, cleaned,
+    skills_extracted, persisted), then a final `done` event with the resume
+    ID, or an `error` event if a stage fails. Disconnecting skips the
+    remaining stages.
+    """
+    
+    # Validate file type
+    allowed_extensions = ['.pdf', '.docx', '.txt']
+    file_ext = os.path.splitext(file.filename)[1].lower()
+    
+    if file_ext not in allowed_extensions:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
+        )
+    
+    # Tracked like a queued upload so the name can't be taken meanwhile
+    resume_id = _reserve_filename(db, file.filename)
+    if resume_id is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Resume with filename '{file.filename}' already exists"
+        )
+    
+    start_time = time.time()
+    filename = file.filename
     try:
-        # Parse document
-        doc_data = document_parser.parse_file(file_path)
-        text = doc_data['text']
-        
-        # Extract profile
-        contact = text_cleaner.extract_contact_info(text)
-        name = text_cleaner.extract_name(text)
-        years_exp = text_cleaner.extract_years_of_experience(text)
-        sections = text_cleaner.extract_sections(text)
+        data = await read_upload_file(file)
+    except BaseException:
+        _release_filename(resume_id)
+        raise
+    file_path = os.path.join(UPLOAD_DIR, filename)
+    partial_path = _partial_path(file_path, resume_id)
+    
+    def event(payload: dict, name: str = None) -> bytes:
+        head = f"event: {name}\n".encode() if name else b""
+        return head + b"data: " + orjson.dumps(payload) + b"\n\n"
+    
+    def stage(name: str, **details) -> bytes:
+        return event(dict(stage=name, elapsed=round(time.time() - start_time, 2), **details))
+    
+    async def events():
+        try:
+            text = (await run_in_threadpool(document_parser.parse_bytes, data, filename))['text']
+            yield stage("parsed", text_length=len(text))
+            
+            extracted = await run_in_threadpool(text_cleaner.extract_all, text)
+            yield stage("cleaned", candidate_name=extracted['name'])
+            
+            profile = await run_in_threadpool(
+                skill_extractor.extract_complete_profile_cached, text, extracted['sections']
+            )
+            embedding = await run_in_threadpool(matcher.encode_text, text)
+            yield stage("skills_extracted", total_skills=profile['skills']['total_skills'])
+            
+            resume_data = _resume_row(
+                resume_id, filename, file_ext, len(data), text, extracted, profile, embedding
+            )
+            await anyio.Path(partial_path).write_bytes(data)
+            
+            # The request's session may already be closed while streaming
+            save_db = SessionLocal()
+            try:
+                await run_in_threadpool(crud.create_resume, save_db, resume_data)
+            finally:
+                save_db.close()
+            os.replace(partial_path, file_path)
+            yield stage("persisted")
+            
+            upload_status.pop(resume_id, None)
+            yield event({"id": resume_id, "filename": filename, "file_size": len(data)}, "done")
+        except Exception as e:
+            message = f"Error processing resume: {str(e)}"
+            _upload_failed(resume_id, filename, message)
+            yield event({"message": message}, "error")
+        finally:
+            # Failed, or the client went away before the resume was stored
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            _release_filename(resume_id)
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+@app.post("/resume/upload_batch", tags=["Resume"])
+async def upload_resumes_batch(
+    files: List[UploadFile] = File(...),
+    db: Session = Depends(get_db)
+):
+    """Upload, parse and store many resumes in one request"""
+    
+    allowed_extensions = ['.pdf', '.docx', '.txt']
+    results = [None] * len(files)
+    accepted = []
+    
+    # Validate every file and claim its name before anything awaits;
+    # rejected files are reported, not fatal
+    for i, file in enumerate(files):
+        file_ext = os.path.splitext(file.filename)[1].lower()
         
-        profile = skill_extractor.extract_complete_profile(text, sections)
+        if file_ext not in allowed_extensions:
+            results[i] = {
+                "filename": file.filename,
+                "status": "error",
+                "message": f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
+            }
+            continue
         
-        # Save to database
-        resume_data = {
-            "filename": file.filename,
-            "original_filename": file.filename,
-            "file_size": file_size,
-            "file_type": file_ext[1:],
-            "candidate_name": name,
-            "email": contact.get('email'),
-            "phone": contact.get('phone'),
-            "linkedin": contact.get('linkedin'),
-            "github": contact.get('github'),
-            "raw_text": text,
-            "years_experience": years_exp,
-            "experience_level": profile['experience_level'],
-            "education_level": profile['education']['highest_level'],
-            "skills": profile['skills']['skills'],
-            "certifications": profile['certifications']
-        }
+        resume_id = _reserve_filename(db, file.filename)
+        if resume_id is None:
+            results[i] = {
+                "filename": file.filename,
+                "status": "error",
+                "message": f"Resume with filename '{file.filename}' already exists"
+            }
+            continue
         
-        resume = crud.create_resume(db, resume_data)
+        file_path = os.path.join(UPLOAD_DIR, file.filename)
+        accepted.append((i, file, resume_id, file_path, file.filename, file_ext))
+    
+    # Names are only reserved while this request runs; its files are written
+    # under names of their own and moved into place once their rows are stored
+    saved = []
+    try:
+        contents = [await read_upload_file(file) for _, file, *_ in accepted]
         
-        return ResumeUploadResponse(
-            filename=file.filename,
-            file_size=file_size,
-            extracted_text_length=len(text),
-            processing_status="success",
-            message=f"Resume uploaded and saved to database (ID: {resume.id})"
+        # Parse all accepted files concurrently in the threadpool, from memory
+        parsed = await asyncio.gather(
+            *(run_in_threadpool(_resume_record, resume_id, data, filename, file_ext)
+              for (_, _, resume_id, _, filename, file_ext), data in zip(accepted, contents)),
+            return_exceptions=True
         )
         
-    except Exception as e:
-        # Clean up file if database save fails
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+        # Only resumes that parsed are written to disk
+        records = []
+        for (i, _, resume_id, file_path, filename, _), data, record in zip(accepted, contents, parsed):
+            if isinstance(record, Exception):
+                results[i] = {
+                    "filename": filename,
+                    "status": "error",
+                    "message": f"Error processing resume: {str(record)}"
+                }
+            else:
+                partial_path = _partial_path(file_path, resume_id)
+                await anyio.Path(partial_path).write_bytes(data)
+                records.append((i, partial_path, file_path, record))
+        
+        # One batched INSERT; if it fails, retry row by row so one bad file
+        # doesn't lose the others
+        if records:
+            try:
+                crud.create_resumes(db, [record for *_, record in records])
+                saved = records
+            except Exception:
+                db.rollback()
+                for entry in records:
+                    i, _, _, record = entry
+                    try:
+                        crud.create_resume(db, record)
+                        saved.append(entry)
+                    except Exception as e:
+                        db.rollback()
+                        results[i] = {
+                            "filename": record["filename"],
+                            "status": "error",
+                            "message": f"Error saving resume: {str(e)}"
+                        }
+        
+        for i, partial_path, file_path, record in saved:
+            os.replace(partial_path, file_path)
+            results[i] = {
+                "id": record["id"],
+                "filename": record["filename"],
+                "status": "completed",
+                "extracted_text_length": len(record["raw_text"])
+            }
+    finally:
+        for _, _, resume_id, file_path, _, _ in accepted:
+            partial_path = _partial_path(file_path, resume_id)
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            _release_filename(resume_id)
+    
+    return {
+        "resumes": results,
+        "total": len(files),
+        "saved": len(saved)
+    }
+
+@app.get("/resume/{resume_id}/status", tags=["Resume"])
+async def get_upload_status(resume_id: str, db: Session = Depends(get_db)):
+    """Get the processing status of an uploaded resume"""
+    
+    if resume_id in upload_status:
+        return dict(upload_status[resume_id], id=resume_id)
+    
+    # Uploads from before this process started are only in the database
+    resume = crud.get_resume(db, resume_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    
+    return {
+        "id": resume_id,
+        "status": "completed",
+        "filename": resume.filename,
+        "extracted_text_length": len(resume.raw_text or "")
+    }
 
 @app.get("/resume/{resume_id}", response_model=ProfileResponse, tags=["Resume"])
 async def get_resume_profile(resume_id: str, db: Session = Depends(get_db)):
@@ -233,8 +662,8 @@ async def get_resume_profile(resume_id: str, db: Session = Depends(get_db)):
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     
-    # Extract profile from stored data
-    profile = skill_extractor.extract_complete_profile(resume.raw_text, {})
+    # Profile saved at upload
+    profile = _resume_profile(resume)
     
     return ProfileResponse(
         filename=resume.filename,
@@ -258,7 +687,7 @@ async def list_all_resumes(
 ):
     """List all resumes from database"""
     
-    resumes = crud.get_all_resumes(db, skip=skip, limit=limit)
+    resumes = crud.list_resumes_lite(db, skip=skip, limit=limit)
     total = crud.get_resume_count(db)
     
     return {
@@ -270,7 +699,7 @@ async def list_all_resumes(
                 "email": r.email,
                 "years_experience": r.years_experience,
                 "experience_level": r.experience_level,
-                "total_skills": len(r.skills) if r.skills else 0,
+                "total_skills": r.total_skills,
                 "created_at": r.created_at.isoformat() if r.created_at else None
             }
             for r in resumes
@@ -288,7 +717,12 @@ async def create_job_description(
     """Create a new job description"""
     
     # Extract skills from job description
-    profile = skill_extractor.extract_complete_profile(job.description, {})
+    profile = await run_in_threadpool(skill_extractor.extract_complete_profile_cached, job.description, {})
+    
+    # Descriptions don't change, so the embedding is computed once here and
+    # reused by every match against this job
+    prepared_job = await run_in_threadpool(matcher.prepare_job, dict(profile, raw_text=job.description))
+    embedding = prepared_job['embedding']
     
     job_data = {
         "title": job.title,
@@ -297,7 +731,8 @@ async def create_job_description(
         "required_skills": job.required_skills,
         "required_education": job.required_education,
         "required_years": job.required_years,
-        "extracted_skills": profile['skills']['skills']
+        "extracted_skills": profile['skills']['skills'],
+        "embedding_fp16": embedding.astype(np.float16).tobytes() if embedding is not None else None
     }
     
     job_record = crud.create_job(db, job_data)
@@ -318,7 +753,7 @@ async def list_all_jobs(
 ):
     """List all job descriptions"""
     
-    jobs = crud.get_all_jobs(db, skip=skip, limit=limit, active_only=active_only)
+    jobs = crud.list_jobs_lite(db, skip=skip, limit=limit, active_only=active_only)
     total = crud.get_job_count(db)
     
     return {
@@ -329,7 +764,7 @@ async def list_all_jobs(
                 "company": j.company,
                 "required_years": j.required_years,
                 "required_education": j.required_education,
-                "total_skills": len(j.required_skills) if j.required_skills else 0,
+                "total_skills": j.total_skills,
                 "created_at": j.created_at.isoformat() if j.created_at else None
             }
             for j in jobs
@@ -337,6 +772,125 @@ async def list_all_jobs(
         "total": total
     }
 
+# Registered before /match/{resume_id}/{job_id}, which would otherwise capture it
+@app.post("/match/batch/{job_id}", response_model=BatchMatchResponse, tags=["Matching"])
+async def match_all_resumes_to_job(job_id: str, db: Session = Depends(get_db)):
+    """Match every stored resume to a job and save the results"""
+    
+    start_time = time.time()
+    
+    job = crud.get_job_for_match(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    resumes = crud.get_resumes_for_match(db)
+    if not resumes:
+        raise HTTPException(status_code=404, detail="No resumes found")
+    
+    # Encode the job once and all resumes in one batched transformer pass,
+    # off the event loop
+    prepared_job = await run_in_threadpool(_prepare_job, job)
+    match_results = await run_in_threadpool(
+        matcher.batch_score, [_match_input(r) for r in resumes], prepared_job,
+        min_skill_match=MIN_SKILL_MATCH
+    )
+    recommendations = [_recommendations(m) for m in match_results]
+    
+    # Responses are built before saving: the commit expires the loaded rows,
+    # and reading them afterwards would reload every column
+    job_title = job.title
+    matches = [
+        _match_response(resume, match_result, recs)
+        for resume, match_result, recs in zip(resumes, match_results, recommendations)
+    ]
+    matches.sort(key=lambda x: x.overall_score, reverse=True)
+    
+    # Save all matches in one transaction
+    try:
+        crud.create_matches(db, [
+            _match_data(resume.id, job_id, match_result, recs)
+            for resume, match_result, recs in zip(resumes, match_results, recommendations)
+        ])
+    except Exception as e:
+        print(f"⚠ Warning: Could not save matches to database: {e}")
+    
+    return BatchMatchResponse(
+        job_title=job_title,
+        total_candidates=len(matches),
+        matches=matches,
+        processing_time=round(time.time() - start_time, 2)
+    )
+
+# Also registered before /match/{resume_id}/{job_id}
+@app.post("/match/topk/{job_id}", response_model=BatchMatchResponse, tags=["Matching"])
+async def match_top_resumes_to_job(
+    job_id: str,
+    k: int = Query(50, ge=1),
+    db: Session = Depends(get_db)
+):
+    """Shortlist the k resumes closest to a job by stored embedding, then fully score only those"""
+    
+    start_time = time.time()
+    
+    job = crud.get_job_for_match(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    prepared_job = await run_in_threadpool(_prepare_job, job)
+    if prepared_job['embedding'] is None:
+        raise HTTPException(status_code=503, detail="Semantic matching is not available")
+    
+    # Resumes uploaded before embeddings were stored are not candidates here
+    stored = crud.get_resume_embeddings(db)
+    if not stored:
+        raise HTTPException(status_code=404, detail="No resumes found")
+    
+    ids = [resume_id for resume_id, _ in stored]
+    embeddings = np.frombuffer(b"".join(e for _, e in stored), dtype=np.float16).reshape(len(stored), -1)
+    similarities = embeddings.astype(np.float32) @ prepared_job['embedding']
+    
+    # Exact nearest neighbours: one matrix-vector product plus a partial sort
+    if k < len(ids):
+        top = np.argpartition(-similarities, k - 1)[:k]
+    else:
+        top = np.arange(len(ids))
+    
+    resumes = crud.get_resumes_for_match(db, [ids[i] for i in top])
+    sims_by_id = {ids[i]: round(float(similarities[i]) * 100, 2) for i in top}
+    
+    match_results = await run_in_threadpool(
+        matcher.batch_score,
+        [_match_input(r) for r in resumes],
+        prepared_job,
+        semantic_sims=[sims_by_id[r.id] for r in resumes],
+        min_skill_match=MIN_SKILL_MATCH
+    )
+    recommendations = [_recommendations(m) for m in match_results]
+    
+    # Responses are built before saving: the commit expires the loaded rows,
+    # and reading them afterwards would reload every column
+    job_title = job.title
+    matches = [
+        _match_response(resume, match_result, recs)
+        for resume, match_result, recs in zip(resumes, match_results, recommendations)
+    ]
+    matches.sort(key=lambda x: x.overall_score, reverse=True)
+    
+    try:
+        crud.create_matches(db, [
+            _match_data(resume.id, job_id, match_result, recs)
+            for resume, match_result, recs in zip(resumes, match_results, recommendations)
+        ])
+    except Exception as e:
+        print(f"⚠ Warning: Could not save matches to database: {e}")
+    
+    return BatchMatchResponse(
+        job_title=job_title,
+        total_candidates=len(matches),
+        matches=matches,
+        processing_time=round(time.time() - start_time, 2)
+    )
+
 @app.post("/match/{resume_id}/{job_id}", response_model=MatchResultResponse, tags=["Matching"])
 async def match_resume_to_job(
     resume_id: str,
@@ -346,74 +900,30 @@ async def match_resume_to_job(
     """Match a resume to a job and save result"""
     
     # Get resume and job from database
-    resume = crud.get_resume(db, resume_id)
-    job = crud.get_job(db, job_id)
+    resume = crud.get_resume_for_match(db, resume_id)
+    job = crud.get_job_for_match(db, job_id)
     
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Prepare profiles
-    resume_profile = skill_extractor.extract_complete_profile(resume.raw_text, {})
-    resume_profile['filename'] = resume.filename
-    resume_profile['name'] = resume.candidate_name
-    resume_profile['years_experience'] = resume.years_experience
-    resume_profile['raw_text'] = resume.raw_text
-    
-    job_profile = skill_extractor.extract_complete_profile(job.description, {})
-    job_profile['raw_text'] = job.description
-    if job.required_skills:
-        job_profile['skills']['skills'] = job.required_skills
-    
-    # Calculate match
-    match_result = matcher.calculate_overall_fit_score(resume_profile, job_profile)
+    # Calculate match in the threadpool; profiling and encoding would
+    # otherwise block the event loop for every other request
+    prepared_job = await run_in_threadpool(_prepare_job, job)
+    match_result = await run_in_threadpool(
+        matcher.score_against, _match_input(resume), prepared_job, min_skill_match=MIN_SKILL_MATCH
+    )
     
     # Generate recommendations
-    recommendations = []
-    if match_result['overall_score'] >= 80:
-        recommendations.append("Excellent fit - Highly recommended for interview")
-    elif match_result['overall_score'] >= 60:
-        recommendations.append("Good fit - Recommend for initial screening")
+    recommendations = _recommendations(match_result)
     
-    missing_skills = match_result['skill_match']['missing_skills']
-    if missing_skills and len(missing_skills) <= 3:
-        recommendations.append(f"Consider acquiring: {', '.join(missing_skills[:3])}")
-    
-    # Helper function to convert numpy types to Python types
-    def convert_to_python_type(obj):
-        """Convert numpy types to Python native types"""
-        import numpy as np
-        if isinstance(obj, (np.integer, np.int64, np.int32)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64, np.float32)):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, dict):
-            return {key: convert_to_python_type(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_to_python_type(item) for item in obj]
-        else:
-            return obj
-    
-    # Save match to database - convert numpy types
-    match_data = {
-        "resume_id": resume_id,
-        "job_id": job_id,
-        "overall_score": float(match_result['overall_score']),
-        "skill_match_percentage": float(match_result['skill_match']['match_percentage']),
-        "text_similarity": float(match_result['text_similarity']),
-        "semantic_similarity": float(match_result['semantic_similarity']),
-        "fit_level": match_result['fit_level'],
-        "skill_match_details": convert_to_python_type(match_result['skill_match']),
-        "experience_match": convert_to_python_type(match_result['experience_match']),
-        "education_match": convert_to_python_type(match_result['education_match']),
-        "recommendations": recommendations
-    }
+    # Built before saving, which expires the loaded rows
+    response = _match_response(resume, match_result, recommendations)
     
+    # Save match to database
     try:
-        match_record = crud.create_match(db, match_data)
+        match_record = crud.create_match(db, _match_data(resume_id, job_id, match_result, recommendations))
         print(f"✓ Match saved to database: {match_record.id}")
     except Exception as e:
         print(f"⚠ Warning: Could not save match to database: {e}")
@@ -421,44 +931,13 @@ async def match_resume_to_job(
         traceback.print_exc()
         # Continue anyway - return the match result even if saving fails
     
-    return MatchResultResponse(
-        candidate_name=resume.candidate_name,
-        filename=resume.filename,
-        overall_score=match_result['overall_score'],
-        fit_level=match_result['fit_level'],
-        skill_match=SkillMatchResponse(**match_result['skill_match']),
-        experience_match=match_result['experience_match'],
-        education_match=match_result['education_match'],
-        text_similarity=match_result['text_similarity'],
-        semantic_similarity=match_result['semantic_similarity'],
-        recommendations=recommendations
-    )
-    
-    match_record = crud.create_match(db, match_data)
-    
-    return MatchResultResponse(
-        candidate_name=resume.candidate_name,
-        filename=resume.filename,
-        overall_score=match_result['overall_score'],
-        fit_level=match_result['fit_level'],
-        skill_match=SkillMatchResponse(**match_result['skill_match']),
-        experience_match=match_result['experience_match'],
-        education_match=match_result['education_match'],
-        text_similarity=match_result['text_similarity'],
-        semantic_similarity=match_result['semantic_similarity'],
-        recommendations=recommendations
-    )
+    return response
 
 @app.get("/stats", tags=["Statistics"])
 async def get_statistics(db: Session = Depends(get_db)):
     """Get system statistics"""
     
-    return {
-        "total_resumes": crud.get_resume_count(db),
-        "total_jobs": crud.get_job_count(db),
-        "total_matches": crud.get_match_count(db),
-        "average_match_score": crud.get_average_match_score(db)
-    }
+    return crud.get_statistics(db)
 
 if __name__ == "__main__":
     import uvicorn
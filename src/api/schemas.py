@@ -15,6 +15,7 @@ class ResumeUploadResponse(BaseModel):
     extracted_text_length: int
     processing_status: str
     message: str
+    resume_id: Optional[str] = None
 
 class JobDescriptionRequest(BaseModel):
     """Request schema for job description"""
@@ -91,6 +92,7 @@ class BatchMatchRequest(BaseModel):
     """Request schema for batch matching"""
     job_description: JobDescriptionRequest
     resume_filenames: Optional[List[str]] = None  # If None, match all resumes
+    top_k: Optional[int] = Field(None, ge=1)  # If None, return every match
 
 class BatchMatchResponse(BaseModel):
     """Response schema for batch matching"""
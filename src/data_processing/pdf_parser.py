@@ -6,13 +6,106 @@ import PyPDF2
 import pdfplumber
 import docx
 import re
+import io
 import os
+import json
+import atexit
+import mmap
+import hashlib
+import tempfile
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pymupdf  # PyMuPDF: much faster text extraction, preferred when installed
+except ImportError:
+    pymupdf = None
+
+# Long PDFs (large files with many pages) are split into page ranges and
+# extracted in worker processes; MuPDF is not thread-safe, so each worker
+# opens its own copy of the document
+PARALLEL_PDF_MIN_BYTES = 1_000_000
+PARALLEL_PDF_MIN_PAGES = 8
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+_pdf_executor = None
+
+# Worker processes used by parse_directory. Starting them costs ~0.4 s, so
+# they are only used for at least PARALLEL_DIR_MIN_FILES PDF/DOCX files or
+# PARALLEL_DIR_MIN_BYTES of them; .txt files are always read inline
+PARSER_WORKERS = int(os.getenv("RESUME_PARSER_WORKERS", os.cpu_count() or 1))
+PARALLEL_DIR_MIN_FILES = 16
+PARALLEL_DIR_MIN_BYTES = 8_000_000
+_worker_parser = None
+
+def _pymupdf_page_range(filepath, start, stop):
+    """Extract the text of pages [start, stop) of a PDF (runs in a worker process)"""
+    with pymupdf.open(filepath) as doc:
+        return [doc[i].get_text('text').strip() for i in range(start, stop)]
+
+def _init_worker_parser(pdf_backend):
+    """Create the parser each parse_directory worker process reuses"""
+    global _worker_parser
+    _worker_parser = DocumentParser(pdf_backend=pdf_backend)
+
+def _parse_one(filepath):
+    """Parse one file in a worker process, returning the error instead of raising it"""
+    try:
+        return _worker_parser.parse_file(filepath)
+    except Exception as e:
+        return e
+
+def _get_pdf_executor():
+    """Process pool for page-range extraction, created on first use"""
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=PDF_WORKERS,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        atexit.register(shutdown_pdf_executor)
+    return _pdf_executor
+
+def shutdown_pdf_executor():
+    """Stop the page-range pool, if it was started (it is recreated on next use)"""
+    global _pdf_executor
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(cancel_futures=True)
+        _pdf_executor = None
 
 class DocumentParser:
     """Parse resumes and job descriptions from various file formats"""
     
-    def __init__(self):
+    def __init__(self, pdf_backend=None, cache_dir=None):
+        """
+        Initialize the parser
+        
+        Parameters:
+        -----------
+        pdf_backend : str, optional
+            Primary PDF backend, 'pymupdf' or 'pdfplumber' (default: PyMuPDF
+            when installed); PyPDF2 is always the last fallback
+        cache_dir : str, optional
+            Directory for cached parse_file results, keyed by path, mtime and
+            size so edited files are re-parsed (caching is off by default)
+        """
         self.supported_formats = ['.pdf', '.docx', '.txt']
+        
+        # PyMuPDF when installed; pdfplumber/PyPDF2 remain as fallbacks
+        if pdf_backend is None:
+            pdf_backend = 'pymupdf' if pymupdf is not None else 'pdfplumber'
+        if pdf_backend not in ('pymupdf', 'pdfplumber'):
+            raise ValueError(f"Unsupported PDF backend: {pdf_backend}")
+        if pdf_backend == 'pymupdf' and pymupdf is None:
+            raise ValueError("PDF backend 'pymupdf' requires PyMuPDF to be installed")
+        self.pdf_backend = pdf_backend
+        
+        # Parse results on disk (JSON per file) with an in-memory LRU in front
+        self.cache_dir = cache_dir
+        self.cache_size = 128
+        self._cache = OrderedDict()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
     
     def parse_file(self, filepath):
         """
@@ -32,6 +125,19 @@ class DocumentParser:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
         
+        key = self._cache_key(filepath) if self.cache_dir else None
+        if key:
+            cached = self._cache_get(key, filepath)
+            if cached is not None:
+                return cached
+        
+        doc = self._parse_file(filepath)
+        if key:
+            self._cache_put(key, doc)
+        return doc
+    
+    def _parse_file(self, filepath):
+        """Parse a file by its extension (parse_file without the cache)"""
         file_ext = os.path.splitext(filepath)[1].lower()
         
         if file_ext not in self.supported_formats:
@@ -52,37 +158,175 @@ class DocumentParser:
             'char_count': len(text)
         }
     
-    def _parse_pdf(self, filepath):
-        """Extract text from PDF using pdfplumber (better formatting)"""
-        text = ""
+    def _cache_key(self, filepath):
+        """Cache key for a file's current version (absolute path, mtime, size)"""
+        st = os.stat(filepath)
+        ident = f"{os.path.abspath(filepath)}:{st.st_mtime_ns}:{st.st_size}"
+        return hashlib.blake2b(ident.encode(), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key, filepath):
+        """Cached parse result (a copy, with the caller's path) or None"""
+        doc = self._cache.get(key)
+        if doc is not None:
+            self._cache.move_to_end(key)
+        else:
+            try:
+                with open(os.path.join(self.cache_dir, f"{key}.json"), 'r', encoding='utf-8') as f:
+                    doc = json.load(f)
+            except (OSError, ValueError):
+                return None
+            self._remember(key, doc)
+        
+        return dict(doc, filename=os.path.basename(filepath), filepath=filepath)
+    
+    def _cache_put(self, key, doc):
+        """Store a parse result in memory and on disk (written atomically)"""
+        self._remember(key, doc)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(doc, f, ensure_ascii=False)
+            os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _remember(self, key, doc):
+        """Add to the in-memory LRU, evicting the oldest entry when full"""
+        self._cache[key] = doc
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def parse_bytes(self, data, filename):
+        """
+        Parse a document that has already been read into memory
+        
+        Parameters:
+        -----------
+        data : bytes-like
+            File contents (bytes, memoryview or a read-only mmap; PDFs are
+            handed to PyMuPDF without copying)
+        filename : str
+            Original file name (its extension selects the format)
+            
+        Returns:
+        --------
+        dict
+            Same as parse_file
+        """
+        
+        file_ext = os.path.splitext(filename)[1].lower()
+        
+        if file_ext not in self.supported_formats:
+            raise ValueError(f"Unsupported file format: {file_ext}")
+        
+        if file_ext == '.pdf':
+            text = self._parse_pdf(memoryview(data))
+        elif file_ext == '.docx':
+            text = self._parse_docx(io.BytesIO(data))
+        elif file_ext == '.txt':
+            text = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='ignore').read().strip()
+        
+        return {
+            'filename': os.path.basename(filename),
+            'filepath': filename,
+            'text': text,
+            'word_count': len(text.split()),
+            'char_count': len(text)
+        }
+    
+    def _parse_pdf(self, source):
+        """Extract text from a PDF path, buffer or binary stream (PyMuPDF, then pdfplumber, then PyPDF2)"""
+        if self.pdf_backend == 'pymupdf':
+            try:
+                return self._parse_pdf_pymupdf(source)
+            except Exception as e:
+                print(f"⚠ PyMuPDF failed, trying pdfplumber: {e}")
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+        
+        # pdfplumber and PyPDF2 need a file-like object
+        if isinstance(source, memoryview):
+            source = io.BytesIO(source)
+        
+        # Page texts are joined once at the end rather than concatenated per page
+        parts = []
         
         try:
             # Try pdfplumber first (better text extraction)
-            with pdfplumber.open(filepath) as pdf:
+            with pdfplumber.open(source) as pdf:
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        parts.append(page_text)
         except Exception as e:
             print(f"⚠ pdfplumber failed, trying PyPDF2: {e}")
             # Fallback to PyPDF2
             try:
-                with open(filepath, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+                    parts.extend(self._pypdf2_page_texts(source))
+                else:
+                    # Given a path, PyPDF2 reads the whole file into a BytesIO
+                    # copy; a read-only map is paged in from the OS page cache
+                    # (shared with any other process parsing the same file)
+                    with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        parts.extend(self._pypdf2_page_texts(mm))
             except Exception as e2:
                 print(f"❌ PyPDF2 also failed: {e2}")
                 raise
         
-        return text.strip()
+        return "\n".join(parts).strip()
+    
+    def _pypdf2_page_texts(self, stream):
+        """Non-empty page texts of a PDF stream, extracted with PyPDF2"""
+        pdf_reader = PyPDF2.PdfReader(stream)
+        return [text for text in (page.extract_text() for page in pdf_reader.pages) if text]
     
-    def _parse_docx(self, filepath):
-        """Extract text from DOCX file"""
+    def _parse_pdf_pymupdf(self, source):
+        """Extract text from a PDF path, buffer or binary stream using PyMuPDF"""
+        # MuPDF documents are not thread-safe, so pages are read sequentially
+        # here and only long PDFs on disk are split across processes
+        if isinstance(source, memoryview):
+            doc = pymupdf.open(stream=source, filetype='pdf')
+        elif hasattr(source, 'read'):
+            doc = pymupdf.open(stream=source.read(), filetype='pdf')
+        else:
+            doc = pymupdf.open(source)
+        
+        with doc:
+            if self._parallel_pages(source, doc.page_count):
+                pages = self._parse_pages_parallel(source, doc.page_count)
+            else:
+                pages = [page.get_text('text').strip() for page in doc]
+        
+        return "\n".join(filter(None, pages)).strip()
+    
+    def _parallel_pages(self, source, page_count):
+        """Whether a PDF is long enough for page-range extraction to pay off"""
+        return (
+            isinstance(source, (str, os.PathLike))
+            and PDF_WORKERS > 1
+            and page_count >= PARALLEL_PDF_MIN_PAGES
+            # Pool workers (e.g. the API's batch workers) stay sequential
+            and multiprocessing.parent_process() is None
+            and os.path.getsize(source) >= PARALLEL_PDF_MIN_BYTES
+        )
+    
+    def _parse_pages_parallel(self, filepath, page_count):
+        """Extract a PDF's pages as contiguous ranges in worker processes, in page order"""
+        step = -(-page_count // PDF_WORKERS)
+        futures = [
+            _get_pdf_executor().submit(_pymupdf_page_range, filepath, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        return [text for future in futures for text in future.result()]
+    
+    def _parse_docx(self, source):
+        """Extract text from a DOCX path or binary stream"""
         try:
-            doc = docx.Document(filepath)
+            doc = docx.Document(source)
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
             return text.strip()
         except Exception as e:
@@ -112,33 +356,106 @@ class DocumentParser:
             List of dictionaries with parsed documents
         """
         
+        return list(self.iter_directory(directory_path))
+    
+    def iter_directory(self, directory_path):
+        """
+        Parse all supported files in a directory, yielding each document as
+        soon as it is ready so the caller can process it while later files
+        are still being parsed
+        
+        Parameters:
+        -----------
+        directory_path : str
+            Path to directory containing files
+            
+        Yields:
+        -------
+        dict
+            Parsed documents, in directory order (failed files are skipped)
+        """
+        
         if not os.path.exists(directory_path):
             raise FileNotFoundError(f"Directory not found: {directory_path}")
         
-        documents = []
         failed_files = []
         
-        for filename in os.listdir(directory_path):
-            filepath = os.path.join(directory_path, filename)
-            
-            if os.path.isfile(filepath):
-                file_ext = os.path.splitext(filename)[1].lower()
+        filepaths = [
+            os.path.join(directory_path, filename)
+            for filename in os.listdir(directory_path)
+            if os.path.isfile(os.path.join(directory_path, filename))
+            and os.path.splitext(filename)[1].lower() in self.supported_formats
+        ]
+        
+        # Cached files are answered here; only the rest need parsing
+        keys = [self._cache_key(filepath) if self.cache_dir else None for filepath in filepaths]
+        results = [
+            self._cache_get(key, filepath) if key else None
+            for key, filepath in zip(keys, filepaths)
+        ]
+        todo = [filepath for filepath, result in zip(filepaths, results) if result is None]
+        
+        def parse_inline(filepath):
+            try:
+                return self._parse_file(filepath)
+            except Exception as e:
+                return e
+        
+        # Enough PDF/DOCX work is parsed in worker processes (RESUME_PARSER_WORKERS,
+        # default one per CPU); everything else is parsed here. Results come
+        # back in directory order either way
+        pool = None
+        pooled_files = [
+            filepath for filepath in todo
+            if os.path.splitext(filepath)[1].lower() != '.txt'
+        ]
+        workers = min(PARSER_WORKERS, len(pooled_files))
+        if (
+            workers > 1
+            and multiprocessing.parent_process() is None
+            and (
+                len(pooled_files) >= PARALLEL_DIR_MIN_FILES
+                or sum(os.path.getsize(filepath) for filepath in pooled_files) >= PARALLEL_DIR_MIN_BYTES
+            )
+        ):
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker_parser,
+                initargs=(self.pdf_backend,)
+            )
+            pooled = pool.map(_parse_one, pooled_files, chunksize=4)
+            pooled_files = set(pooled_files)
+        else:
+            pooled_files = set()
+        
+        parsed = (
+            next(pooled) if filepath in pooled_files else parse_inline(filepath)
+            for filepath in todo
+        )
+        
+        try:
+            for filepath, key, result in zip(filepaths, keys, results):
+                if result is None:
+                    result = next(parsed)
+                    if key and not isinstance(result, Exception):
+                        self._cache_put(key, result)
                 
-                if file_ext in self.supported_formats:
-                    try:
-                        doc = self.parse_file(filepath)
-                        documents.append(doc)
-                        print(f"✓ Parsed: {filename} ({doc['word_count']} words)")
-                    except Exception as e:
-                        print(f"❌ Error parsing {filename}: {e}")
-                        failed_files.append(filename)
+                filename = os.path.basename(filepath)
+                if isinstance(result, Exception):
+                    print(f"❌ Error parsing {filename}: {result}")
+                    failed_files.append(filename)
+                else:
+                    print(f"✓ Parsed: {filename} ({result['word_count']} words)")
+                    yield result
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
         
         if failed_files:
             print(f"\n⚠ Failed to parse {len(failed_files)} file(s):")
             for f in failed_files:
                 print(f"  - {f}")
-        
-        return documents
     
     def get_file_info(self, filepath):
         """Get basic file information without parsing"""
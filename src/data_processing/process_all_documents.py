@@ -4,48 +4,81 @@ Process all documents and save structured data
 
 import sys
 import os
-import json
+import orjson
 import pandas as pd
 
+try:
+    import pyarrow as pa  # columnar Parquet copies of the processed data, written when installed
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data_processing.pdf_parser import DocumentParser
 from data_processing.text_cleaner import TextCleaner
 
-def process_resumes(resume_dir='data/sample/resumes', output_dir='data/processed'):
-    """Process all resumes and save structured data"""
+# Parse results are cached here, so re-runs only parse new or edited files
+PARSE_CACHE_DIR = os.getenv('RESUME_PARSE_CACHE_DIR', '.cache/parser')
+
+def save_parquet(processed_data, output_file):
+    """
+    Save processed records column by column as zstd-compressed Parquet (needs pyarrow)
+    
+    This is an optional copy of the JSON output, so failures are reported
+    rather than raised. Dict fields (sections) are written as map<string, string>
+    columns, which also works when every dict is empty.
+    """
+    try:
+        columns = {}
+        for key in processed_data[0]:
+            values = [record[key] for record in processed_data]
+            if any(isinstance(value, dict) for value in values):
+                columns[key] = pa.array(
+                    [list(value.items()) if value is not None else None for value in values],
+                    type=pa.map_(pa.string(), pa.string())
+                )
+            else:
+                columns[key] = values
+        pq.write_table(pa.table(columns), output_file, compression='zstd')
+    except Exception as e:
+        print(f"⚠ Could not save columnar copy to {output_file}: {e}")
+        return
+    
+    print(f"✓ Saved columnar copy to {output_file}")
+
+def process_resumes(resume_dir='data/sample/resumes', output_dir='data/processed', parser=None, cleaner=None):
+    """Process all resumes and save structured data (parser/cleaner may be shared)"""
     
-    parser = DocumentParser()
-    cleaner = TextCleaner()
+    parser = parser or DocumentParser(cache_dir=PARSE_CACHE_DIR)
+    cleaner = cleaner or TextCleaner()
     
     print("="*70)
     print("PROCESSING RESUMES")
     print("="*70)
     
-    # Parse all resumes
-    resumes = parser.parse_directory(resume_dir)
-    
     processed_data = []
     
-    for resume in resumes:
+    # Each resume is cleaned as soon as it is parsed, while the parser's
+    # worker processes carry on with the rest of the directory
+    for resume in parser.iter_directory(resume_dir):
         text = resume['text']
         
         # Extract information
-        contact = cleaner.extract_contact_info(text)
-        name = cleaner.extract_name(text)
-        years_exp = cleaner.extract_years_of_experience(text)
-        sections = cleaner.extract_sections(text)
+        extracted = cleaner.extract_all(text)
+        contact = extracted['contact']
+        sections = extracted['sections']
         
         # Store processed data
         processed = {
             'filename': resume['filename'],
-            'name': name,
+            'name': extracted['name'],
             'email': contact['email'],
             'phone': contact['phone'],
             'linkedin': contact['linkedin'],
             'github': contact['github'],
-            'years_experience': years_exp,
+            'years_experience': extracted['years_experience'],
             'raw_text': text,
             'sections': sections,
             'word_count': resume['word_count']
@@ -58,29 +91,30 @@ def process_resumes(resume_dir='data/sample/resumes', output_dir='data/processed
     os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, 'processed_resumes.json')
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, indent=2, ensure_ascii=False)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(processed_data, option=orjson.OPT_INDENT_2))
     
     print(f"\n✓ Saved {len(processed_data)} processed resumes to {output_file}")
     
+    if pa is not None and processed_data:
+        save_parquet(processed_data, os.path.join(output_dir, 'processed_resumes.parquet'))
+    
     return processed_data
 
-def process_job_descriptions(jd_dir='data/sample/job_descriptions', output_dir='data/processed'):
-    """Process all job descriptions and save structured data"""
+def process_job_descriptions(jd_dir='data/sample/job_descriptions', output_dir='data/processed', parser=None, cleaner=None):
+    """Process all job descriptions and save structured data (parser/cleaner may be shared)"""
     
-    parser = DocumentParser()
-    cleaner = TextCleaner()
+    parser = parser or DocumentParser(cache_dir=PARSE_CACHE_DIR)
+    cleaner = cleaner or TextCleaner()
     
     print("\n" + "="*70)
     print("PROCESSING JOB DESCRIPTIONS")
     print("="*70)
     
-    # Parse all job descriptions
-    job_descriptions = parser.parse_directory(jd_dir)
-    
     processed_data = []
     
-    for jd in job_descriptions:
+    # Parsed and cleaned one by one, as for resumes
+    for jd in parser.iter_directory(jd_dir):
         text = jd['text']
         sections = cleaner.extract_sections(text)
         
@@ -98,11 +132,14 @@ def process_job_descriptions(jd_dir='data/sample/job_descriptions', output_dir='
     # Save to JSON
     output_file = os.path.join(output_dir, 'processed_job_descriptions.json')
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, indent=2, ensure_ascii=False)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(processed_data, option=orjson.OPT_INDENT_2))
     
     print(f"\n✓ Saved {len(processed_data)} processed job descriptions to {output_file}")
     
+    if pa is not None and processed_data:
+        save_parquet(processed_data, os.path.join(output_dir, 'processed_job_descriptions.parquet'))
+    
     return processed_data
 
 def main():
@@ -112,11 +149,15 @@ def main():
     print("DOCUMENT PROCESSING PIPELINE")
     print("="*70)
     
+    # One parser and cleaner (compiled patterns, caches) for both passes
+    parser = DocumentParser(cache_dir=PARSE_CACHE_DIR)
+    cleaner = TextCleaner()
+    
     # Process resumes
-    resumes = process_resumes()
+    resumes = process_resumes(parser=parser, cleaner=cleaner)
     
     # Process job descriptions
-    job_descriptions = process_job_descriptions()
+    job_descriptions = process_job_descriptions(parser=parser, cleaner=cleaner)
     
     print("\n" + "="*70)
     print("PROCESSING COMPLETE!")
@@ -4,6 +4,14 @@ Clean and preprocess extracted text
 
 import re
 import string
+import hashlib
+import threading
+from collections import OrderedDict
+
+try:
+    import re2  # google-re2: linear-time matching for the contact patterns, used when installed
+except ImportError:
+    re2 = None
 
 class TextCleaner:
     """Clean and normalize text from resumes and job descriptions"""
@@ -15,6 +23,75 @@ class TextCleaner:
         self.url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
         self.linkedin_pattern = r'linkedin\.com/in/[\w-]+'
         self.github_pattern = r'github\.com/[\w-]+'
+        
+        # Compiled once and shared by every extractor call. These run over
+        # arbitrary uploaded text, so they use RE2 (no backtracking) when it is
+        # installed; case-insensitivity is inline so both engines accept it
+        contact_re = re2 if re2 is not None else re
+        self.regex_backend = 're2' if re2 is not None else 're'
+        self._email_re = contact_re.compile(self.email_pattern)
+        self._phone_re = contact_re.compile(self.phone_pattern)
+        self._url_re = contact_re.compile(self.url_pattern)
+        self._linkedin_re = contact_re.compile('(?i)' + self.linkedin_pattern)
+        self._github_re = contact_re.compile('(?i)' + self.github_pattern)
+        
+        # Patterns like "5 years", "5+ years", "5-7 years"
+        self._years_res = [
+            re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'),
+            re.compile(r'experience[:\s]+(\d+)\+?\s*years?'),
+            re.compile(r'(\d+)\s*-\s*\d+\s*years?\s*(?:of\s*)?experience')
+        ]
+        
+        # Work date ranges (e.g., 2020 - 2023, 2019 - Present); matched
+        # against lowercased text, so no IGNORECASE
+        self._date_res = [
+            re.compile(r'(\d{4})\s*-\s*(\d{4})'),
+            re.compile(r'(\d{4})\s*-\s*(?:present|current)'),
+        ]
+        
+        # Whitespace, bullet and punctuation patterns for clean_text/normalize_text
+        self._spaces_tabs_re = re.compile(r'\t+| {2,}')
+        self._newlines_re = re.compile(r'\n{2,}')
+        self._whitespace_re = re.compile(r'\s+')
+        self._bullet_table = str.maketrans('', '', '•●◦▪▫')
+        self._non_word_re = re.compile(r'[^\w\s]')
+        
+        # Common section headers and their variations
+        self.section_keywords = {
+            'summary': ['SUMMARY', 'PROFILE', 'OBJECTIVE', 'ABOUT', 'PROFESSIONAL SUMMARY'],
+            'experience': ['EXPERIENCE', 'WORK HISTORY', 'EMPLOYMENT', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE'],
+            'education': ['EDUCATION', 'ACADEMIC', 'QUALIFICATIONS', 'ACADEMIC BACKGROUND'],
+            'skills': ['SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'EXPERTISE', 'TECHNICAL EXPERTISE'],
+            'certifications': ['CERTIFICATIONS', 'CERTIFICATES', 'LICENSES', 'PROFESSIONAL CERTIFICATIONS'],
+            'projects': ['PROJECTS', 'KEY PROJECTS', 'NOTABLE PROJECTS'],
+            'awards': ['AWARDS', 'HONORS', 'ACHIEVEMENTS', 'RECOGNITION'],
+            'publications': ['PUBLICATIONS', 'PAPERS', 'RESEARCH']
+        }
+        
+        # One case-insensitive pattern for every section header: a keyword
+        # after a newline and at most three indent/bullet characters. Keywords
+        # are grouped by first letter (far fewer branches tried per line) and
+        # longest first, so "TECHNICAL SKILLS" wins over "SKILLS"
+        self._keyword_sections = {
+            keyword: section_name
+            for section_name, keywords in self.section_keywords.items()
+            for keyword in keywords
+        }
+        keywords_by_letter = {}
+        for keyword in sorted(self._keyword_sections, key=len, reverse=True):
+            keywords_by_letter.setdefault(keyword[0], []).append(re.escape(keyword[1:]))
+        self._section_header_re = re.compile(
+            r'(?ai)\n[^\w\n]{0,3}(' + '|'.join(
+                f"{re.escape(letter)}(?:{'|'.join(rests)})"
+                for letter, rests in keywords_by_letter.items()
+            ) + r')\b'
+        )
+        self._header_tail_re = re.compile(r'[:\s]*')
+        
+        # Sections keyed by a hash of the text (LRU)
+        self.sections_cache_size = 1024
+        self._sections_cache = OrderedDict()
+        self._sections_cache_lock = threading.Lock()
     
     def clean_text(self, text, preserve_structure=True):
         """
@@ -38,15 +115,15 @@ class TextCleaner:
         
         # Remove extra whitespace but preserve line breaks if needed
         if preserve_structure:
-            text = re.sub(r' +', ' ', text)  # Multiple spaces to single
-            text = re.sub(r'\n+', '\n', text)  # Multiple newlines to single
-            text = re.sub(r'\t+', ' ', text)  # Tabs to spaces
+            text = self._spaces_tabs_re.sub(' ', text)  # Tab runs and multiple spaces to single
+            text = self._newlines_re.sub('\n', text)  # Multiple newlines to single
         else:
-            text = re.sub(r'\s+', ' ', text)  # All whitespace to single space
+            text = self._whitespace_re.sub(' ', text)  # All whitespace to single space
         
         # Remove bullet points and special characters but keep important ones
         # Keep: alphanumeric, spaces, newlines, periods, commas, hyphens, +, #, (), /
-        text = re.sub(r'[•●◦▪▫]', '', text)  # Remove bullet points
+        # (after the whitespace collapse, so spaces around a bullet stay as they were)
+        text = text.translate(self._bullet_table)  # Remove bullet points
         
         return text.strip()
     
@@ -65,26 +142,25 @@ class TextCleaner:
             Dictionary with email, phone, and URLs
         """
         
-        # Extract email
-        emails = re.findall(self.email_pattern, text)
-        
-        # Extract phone
-        phones = re.findall(self.phone_pattern, text)
-        
-        # Extract LinkedIn
-        linkedin = re.findall(self.linkedin_pattern, text, re.IGNORECASE)
+        # Each pattern needs a literal ('@', 'linkedin.com', ...) to match, so
+        # a plain substring check skips the regex on text that can't match
+        text_lower = text.lower()
         
-        # Extract GitHub
-        github = re.findall(self.github_pattern, text, re.IGNORECASE)
+        # Only the first email/LinkedIn/GitHub/phone is used, so stop scanning there
+        email = self._email_re.search(text) if '@' in text else None
+        linkedin = self._linkedin_re.search(text) if 'linkedin.com/in/' in text_lower else None
+        github = self._github_re.search(text) if 'github.com/' in text_lower else None
+        phone = self._phone_re.search(text)
         
         # Extract generic URLs
-        urls = re.findall(self.url_pattern, text)
+        urls = self._url_re.findall(text) if 'http' in text else []
         
         return {
-            'email': emails[0] if emails else None,
-            'phone': phones[0] if phones else None,
-            'linkedin': linkedin[0] if linkedin else None,
-            'github': github[0] if github else None,
+            'email': email.group() if email else None,
+            # findall() on this pattern returned its (optional) country-code group
+            'phone': (phone.group(1) or '') if phone else None,
+            'linkedin': linkedin.group() if linkedin else None,
+            'github': github.group() if github else None,
             'urls': urls
         }
     
@@ -114,11 +190,11 @@ class TextCleaner:
                 continue
             
             # Skip lines with email or phone
-            if re.search(self.email_pattern, line) or re.search(self.phone_pattern, line):
+            if self._email_re.search(line) or self._phone_re.search(line):
                 continue
             
             # Skip lines with URLs
-            if re.search(self.url_pattern, line):
+            if self._url_re.search(line):
                 continue
             
             # Check if line looks like a name (2-4 words, each capitalized)
@@ -144,55 +220,73 @@ class TextCleaner:
             Dictionary with different sections
         """
         
-        text_upper = text.upper()
-        sections = {}
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
         
-        # Common section headers and their variations
-        section_keywords = {
-            'summary': ['SUMMARY', 'PROFILE', 'OBJECTIVE', 'ABOUT', 'PROFESSIONAL SUMMARY'],
-            'experience': ['EXPERIENCE', 'WORK HISTORY', 'EMPLOYMENT', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE'],
-            'education': ['EDUCATION', 'ACADEMIC', 'QUALIFICATIONS', 'ACADEMIC BACKGROUND'],
-            'skills': ['SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'EXPERTISE', 'TECHNICAL EXPERTISE'],
-            'certifications': ['CERTIFICATIONS', 'CERTIFICATES', 'LICENSES', 'PROFESSIONAL CERTIFICATIONS'],
-            'projects': ['PROJECTS', 'KEY PROJECTS', 'NOTABLE PROJECTS'],
-            'awards': ['AWARDS', 'HONORS', 'ACHIEVEMENTS', 'RECOGNITION'],
-            'publications': ['PUBLICATIONS', 'PAPERS', 'RESEARCH']
-        }
+        with self._sections_cache_lock:
+            sections = self._sections_cache.get(key)
+            if sections is not None:
+                self._sections_cache.move_to_end(key)
+        
+        if sections is None:
+            sections = self._extract_sections(text)
+            with self._sections_cache_lock:
+                self._sections_cache[key] = sections
+                if len(self._sections_cache) > self.sections_cache_size:
+                    self._sections_cache.popitem(last=False)
         
-        # Find all section positions
+        # Section texts are strings, so a shallow copy keeps the cache intact
+        return dict(sections)
+    
+    def _extract_sections(self, text):
+        """Locate section headers and split the text into sections (uncached)"""
+        sections = {}
+        
+        # First header of each section, in text order (the leading newline
+        # lets a header on the first line match too)
         section_positions = []
-        for section_name, keywords in section_keywords.items():
-            for keyword in keywords:
-                pos = text_upper.find(keyword)
-                if pos != -1:
-                    # Make sure it's at the start of a line (or near start)
-                    # Check characters before to ensure it's a header
-                    start_of_line = text_upper.rfind('\n', 0, pos)
-                    if start_of_line == -1 or pos - start_of_line < 5:
-                        section_positions.append((pos, section_name, keyword))
-                        break  # Found this section, move to next
-        
-        # Sort by position
-        section_positions.sort()
+        seen = set()
+        for match in self._section_header_re.finditer('\n' + text):
+            section_name = self._keyword_sections[match.group(1).upper()]
+            if section_name not in seen:
+                seen.add(section_name)
+                section_positions.append((match.start(1) - 1, match.end(1) - 1, section_name))
         
         # Extract text for each section
-        for i, (pos, section_name, keyword) in enumerate(section_positions):
+        for i, (pos, header_end, section_name) in enumerate(section_positions):
             # Find end position (start of next section or end of text)
             if i < len(section_positions) - 1:
                 end_pos = section_positions[i + 1][0]
             else:
                 end_pos = len(text)
             
-            # Extract section text
-            section_text = text[pos:end_pos].strip()
-            
-            # Remove the section header from the text
-            section_text = re.sub(f'^{re.escape(keyword)}[:\s]*', '', section_text, flags=re.IGNORECASE)
-            
-            sections[section_name] = section_text.strip()
+            # Section text without its header (and a trailing colon/space)
+            body_start = self._header_tail_re.match(text, header_end, end_pos).end()
+            sections[section_name] = text[body_start:end_pos].strip()
         
         return sections
     
+    def extract_all(self, text):
+        """
+        Extract contact info, name, years of experience and sections in one call
+        
+        Parameters:
+        -----------
+        text : str
+            Resume text
+            
+        Returns:
+        --------
+        dict
+            Dictionary with contact, name, years_experience and sections
+        """
+        
+        return {
+            'contact': self.extract_contact_info(text),
+            'name': self.extract_name(text),
+            'years_experience': self.extract_years_of_experience(text),
+            'sections': self.extract_sections(text)
+        }
+    
     def normalize_text(self, text):
         """
         Normalize text for comparison (lowercase, remove extra chars)
@@ -209,8 +303,8 @@ class TextCleaner:
         """
         
         text = text.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = self._non_word_re.sub(' ', text)
+        text = self._whitespace_re.sub(' ', text)
         return text.strip()
     
     def extract_years_of_experience(self, text):
@@ -228,34 +322,19 @@ class TextCleaner:
             Estimated years of experience
         """
         
-        # Look for patterns like "5 years", "5+ years", "5-7 years"
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'experience[:\s]+(\d+)\+?\s*years?',
-            r'(\d+)\s*-\s*\d+\s*years?\s*(?:of\s*)?experience'
-        ]
-        
-        max_years = 0
         text_lower = text.lower()
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                years = int(match)
-                max_years = max(max_years, years)
+        max_years = max(
+            (int(match) for pattern in self._years_res for match in pattern.findall(text_lower)),
+            default=0
+        )
         
         # Also try to estimate from work experience dates
-        # Look for year patterns (e.g., 2020 - 2023, 2019 - Present)
-        date_patterns = [
-            r'(\d{4})\s*-\s*(\d{4})',
-            r'(\d{4})\s*-\s*(?:present|current)',
-        ]
-        
         current_year = 2024
         total_experience = 0
         
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
+        for pattern in self._date_res:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 start_year = int(match[0])
                 if len(match) > 1 and match[1].isdigit():
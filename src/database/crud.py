@@ -2,8 +2,8 @@
 CRUD operations for database
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func, or_
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import select, insert, update, exists, func, or_
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -11,6 +11,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from src.database.models import Resume, JobDescription, Match, User
 from typing import List, Optional
 
+# Columns the matching endpoints read; contact details, file metadata and
+# stored embeddings are left unloaded
+_RESUME_MATCH_COLUMNS = (
+    Resume.filename, Resume.candidate_name, Resume.years_experience, Resume.raw_text,
+    Resume.profile, Resume.skills, Resume.education_level, Resume.experience_level,
+    Resume.certifications
+)
+_JOB_MATCH_COLUMNS = (
+    JobDescription.title, JobDescription.description, JobDescription.required_skills,
+    JobDescription.embedding_fp16
+)
+
 # Resume CRUD
 
 def create_resume(db: Session, resume_data: dict) -> Resume:
@@ -21,6 +33,11 @@ def create_resume(db: Session, resume_data: dict) -> Resume:
     db.refresh(resume)
     return resume
 
+def create_resumes(db: Session, resumes_data: List[dict]) -> None:
+    """Create many resume records with one batched INSERT in one transaction"""
+    db.execute(insert(Resume), resumes_data)
+    db.commit()
+
 def get_resume(db: Session, resume_id: str) -> Optional[Resume]:
     """Get resume by ID"""
     return db.execute(select(Resume).where(Resume.id == resume_id)).scalar_one_or_none()
@@ -29,19 +46,59 @@ def get_resume_by_filename(db: Session, filename: str) -> Optional[Resume]:
     """Get resume by filename"""
     return db.execute(select(Resume).where(Resume.filename == filename)).scalar_one_or_none()
 
+def resume_filename_exists(db: Session, filename: str) -> bool:
+    """Check whether a resume with this filename is stored (index lookup, no row fetched)"""
+    return db.execute(select(exists().where(Resume.filename == filename))).scalar()
+
 def get_all_resumes(db: Session, skip: int = 0, limit: int = 100) -> List[Resume]:
     """Get all resumes with pagination"""
     return db.execute(select(Resume).offset(skip).limit(limit)).scalars().all()
 
+def list_resumes_lite(db: Session, skip: int = 0, limit: int = 100) -> List[tuple]:
+    """List resume summary columns as plain rows (no ORM objects, no raw_text)"""
+    return db.execute(
+        select(
+            Resume.id,
+            Resume.filename,
+            Resume.candidate_name,
+            Resume.email,
+            Resume.years_experience,
+            Resume.experience_level,
+            func.coalesce(func.json_array_length(Resume.skills), 0).label("total_skills"),
+            Resume.created_at
+        ).offset(skip).limit(limit)
+    ).all()
+
+def get_resume_for_match(db: Session, resume_id: str) -> Optional[Resume]:
+    """Get a resume with only the columns matching needs loaded"""
+    return db.execute(
+        select(Resume).options(load_only(*_RESUME_MATCH_COLUMNS)).where(Resume.id == resume_id)
+    ).scalar_one_or_none()
+
+def get_resumes_for_match(db: Session, resume_ids: Optional[List[str]] = None) -> List[Resume]:
+    """Get all resumes, or the given IDs in the order given, with only the columns matching needs loaded"""
+    query = select(Resume).options(load_only(*_RESUME_MATCH_COLUMNS))
+    if resume_ids is None:
+        return db.execute(query).scalars().all()
+    
+    resumes = db.execute(query.where(Resume.id.in_(resume_ids))).scalars().all()
+    by_id = {r.id: r for r in resumes}
+    return [by_id[resume_id] for resume_id in resume_ids if resume_id in by_id]
+
+def get_resume_embeddings(db: Session) -> List[tuple]:
+    """Get (id, embedding_fp16) for every resume with a stored embedding"""
+    return db.execute(
+        select(Resume.id, Resume.embedding_fp16).where(Resume.embedding_fp16.is_not(None))
+    ).all()
+
 def update_resume(db: Session, resume_id: str, resume_data: dict) -> Optional[Resume]:
-    """Update resume"""
-    resume = get_resume(db, resume_id)
-    if resume:
-        for key, value in resume_data.items():
-            setattr(resume, key, value)
-        db.commit()
-        db.refresh(resume)
-    return resume
+    """Update resume with a single UPDATE (no load before, no refresh after)"""
+    result = db.execute(
+        update(Resume).where(Resume.id == resume_id).values(**resume_data),
+        execution_options={"synchronize_session": False}
+    )
+    db.commit()
+    return get_resume(db, resume_id) if result.rowcount else None
 
 def delete_resume(db: Session, resume_id: str) -> bool:
     """Delete resume"""
@@ -54,6 +111,7 @@ def delete_resume(db: Session, resume_id: str) -> bool:
 
 def search_resumes(db: Session, query: str) -> List[Resume]:
     """Search resumes by name, email, or skills"""
+    # Substring ILIKE is served by the pg_trgm GIN indexes on PostgreSQL
     search_pattern = f"%{query}%"
     return db.execute(
         select(Resume).where(
@@ -74,10 +132,21 @@ def create_job(db: Session, job_data: dict) -> JobDescription:
     db.refresh(job)
     return job
 
+def create_jobs(db: Session, jobs_data: List[dict]) -> None:
+    """Create many job descriptions with one batched INSERT in one transaction"""
+    db.execute(insert(JobDescription), jobs_data)
+    db.commit()
+
 def get_job(db: Session, job_id: str) -> Optional[JobDescription]:
     """Get job by ID"""
     return db.execute(select(JobDescription).where(JobDescription.id == job_id)).scalar_one_or_none()
 
+def get_job_for_match(db: Session, job_id: str) -> Optional[JobDescription]:
+    """Get a job with only the columns matching needs loaded"""
+    return db.execute(
+        select(JobDescription).options(load_only(*_JOB_MATCH_COLUMNS)).where(JobDescription.id == job_id)
+    ).scalar_one_or_none()
+
 def get_all_jobs(db: Session, skip: int = 0, limit: int = 100, active_only: bool = True) -> List[JobDescription]:
     """Get all job descriptions"""
     query = select(JobDescription)
@@ -85,15 +154,29 @@ def get_all_jobs(db: Session, skip: int = 0, limit: int = 100, active_only: bool
         query = query.where(JobDescription.is_active == True)
     return db.execute(query.offset(skip).limit(limit)).scalars().all()
 
+def list_jobs_lite(db: Session, skip: int = 0, limit: int = 100, active_only: bool = True) -> List[tuple]:
+    """List job summary columns as plain rows (no ORM objects, no description)"""
+    query = select(
+        JobDescription.id,
+        JobDescription.title,
+        JobDescription.company,
+        JobDescription.required_years,
+        JobDescription.required_education,
+        func.coalesce(func.json_array_length(JobDescription.required_skills), 0).label("total_skills"),
+        JobDescription.created_at
+    )
+    if active_only:
+        query = query.where(JobDescription.is_active == True)
+    return db.execute(query.offset(skip).limit(limit)).all()
+
 def update_job(db: Session, job_id: str, job_data: dict) -> Optional[JobDescription]:
-    """Update job description"""
-    job = get_job(db, job_id)
-    if job:
-        for key, value in job_data.items():
-            setattr(job, key, value)
-        db.commit()
-        db.refresh(job)
-    return job
+    """Update job description with a single UPDATE (no load before, no refresh after)"""
+    result = db.execute(
+        update(JobDescription).where(JobDescription.id == job_id).values(**job_data),
+        execution_options={"synchronize_session": False}
+    )
+    db.commit()
+    return get_job(db, job_id) if result.rowcount else None
 
 def delete_job(db: Session, job_id: str) -> bool:
     """Delete job description"""
@@ -114,6 +197,11 @@ def create_match(db: Session, match_data: dict) -> Match:
     db.refresh(match)
     return match
 
+def create_matches(db: Session, matches_data: List[dict]) -> None:
+    """Create many match records with one batched INSERT in one transaction"""
+    db.execute(insert(Match), matches_data)
+    db.commit()
+
 def get_match(db: Session, match_id: str) -> Optional[Match]:
     """Get match by ID"""
     return db.execute(select(Match).where(Match.id == match_id)).scalar_one_or_none()
@@ -160,4 +248,22 @@ def get_match_count(db: Session) -> int:
 def get_average_match_score(db: Session) -> float:
     """Get average match score across all matches"""
     result = db.execute(select(func.avg(Match.overall_score))).scalar()
-    return float(result) if result else 0.0
\ No newline at end of file
+    return float(result) if result else 0.0
+
+def get_statistics(db: Session) -> dict:
+    """Get all counts and the average match score in one query"""
+    row = db.execute(
+        select(
+            select(func.count(Resume.id)).scalar_subquery().label("total_resumes"),
+            select(func.count(JobDescription.id)).where(JobDescription.is_active == True).scalar_subquery().label("total_jobs"),
+            select(func.count(Match.id)).scalar_subquery().label("total_matches"),
+            select(func.avg(Match.overall_score)).scalar_subquery().label("average_match_score")
+        )
+    ).one()
+    
+    return {
+        "total_resumes": row.total_resumes,
+        "total_jobs": row.total_jobs,
+        "total_matches": row.total_matches,
+        "average_match_score": float(row.average_match_score) if row.average_match_score else 0.0
+    }
\ No newline at end of file
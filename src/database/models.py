@@ -2,7 +2,7 @@
 SQLAlchemy models for database tables - Simplified version
 """
 
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, JSON, Boolean, LargeBinary, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.ext.declarative import declarative_base
 import uuid
@@ -12,6 +12,13 @@ import sys
 # Get the database Base from a fresh declarative_base
 Base = declarative_base()
 
+# Trigram indexes (PostgreSQL only) need the pg_trgm extension
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
 def generate_uuid():
     """Generate UUID for primary keys"""
     return str(uuid.uuid4())
@@ -43,9 +50,29 @@ class Resume(Base):
     skills = Column(JSON)
     certifications = Column(JSON)
     
+    # Extracted profile (skills, education, ...) saved at upload so it is
+    # never recomputed on reads and matches
+    profile = Column(JSON)
+    
+    # Normalized resume embedding (float16 bytes), computed once at upload
+    embedding_fp16 = Column(LargeBinary)
+    
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Trigram GIN indexes serve search_resumes' ILIKE '%query%' lookups on
+    # PostgreSQL; other databases skip them
+    __table_args__ = (
+        Index(
+            "ix_resumes_candidate_name_trgm", "candidate_name",
+            postgresql_using="gin", postgresql_ops={"candidate_name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_resumes_email_trgm", "email",
+            postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
 class JobDescription(Base):
     """Job description table"""
@@ -64,6 +91,9 @@ class JobDescription(Base):
     # Extracted data
     extracted_skills = Column(JSON)
     
+    # Normalized description embedding (float16 bytes), computed once at creation
+    embedding_fp16 = Column(LargeBinary)
+    
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
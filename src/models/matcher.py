@@ -3,6 +3,7 @@ Match resumes to job descriptions and calculate fit scores
 """
 
 import numpy as np
+import torch
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from sentence_transformers import SentenceTransformer
@@ -16,7 +17,7 @@ from models.skill_extractor import SkillExtractor
 class ResumeJobMatcher:
     """Match resumes to job descriptions using multiple techniques"""
     
-    def __init__(self, use_transformers=True):
+    def __init__(self, use_transformers=True, precision='auto'):
         """
         Initialize the matcher
         
@@ -24,6 +25,10 @@ class ResumeJobMatcher:
         -----------
         use_transformers : bool
             Whether to use transformer models for semantic matching
+        precision : str
+            Transformer weights dtype: 'auto' (FP16 on GPU, FP32 on CPU),
+            'fp16', 'bf16' (for CPUs with native BF16/AMX), 'int8' (dynamic
+            int8 quantization of the linear layers, CPU only) or 'fp32'
         """
         
         self.skill_extractor = SkillExtractor(use_large_model=False)
@@ -33,11 +38,25 @@ class ResumeJobMatcher:
         if use_transformers:
             print("Loading transformer model (this may take a moment)...")
             self.transformer = SentenceTransformer('all-MiniLM-L6-v2')
-            print("✓ Transformer model loaded")
+            
+            if precision == 'auto':
+                precision = 'fp16' if self.transformer.device.type == 'cuda' else 'fp32'
+            if precision == 'fp16':
+                self.transformer.half()
+            elif precision == 'bf16':
+                self.transformer.to(torch.bfloat16)
+            elif precision == 'int8':
+                # Quantized kernels only run on CPU; activations stay FP32
+                self.transformer.to('cpu')
+                torch.ao.quantization.quantize_dynamic(
+                    self.transformer, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+                )
+            
+            print(f"✓ Transformer model loaded ({precision})")
         else:
             self.transformer = None
     
-    def calculate_skill_match(self, resume_skills, job_skills):
+    def calculate_skill_match(self, resume_skills, job_skills, job_skill_keys=None):
         """
         Calculate skill match percentage
         
@@ -47,6 +66,8 @@ class ResumeJobMatcher:
             List of skills from resume
         job_skills : list
             List of required skills from job
+        job_skill_keys : list, optional
+            Lowercased job_skills, precomputed by prepare_job
             
         Returns:
         --------
@@ -62,21 +83,29 @@ class ResumeJobMatcher:
                 'extra_skills': []
             }
         
-        resume_skills_set = set([s.lower() for s in resume_skills])
-        job_skills_set = set([s.lower() for s in job_skills])
+        # Lowercase each skill once and reuse the keys below
+        if job_skill_keys is None:
+            job_skill_keys = [s.lower() for s in job_skills]
+        resume_skill_keys = [s.lower() for s in resume_skills]
+        
+        resume_skills_set = set(resume_skill_keys)
+        job_skills_set = set(job_skill_keys)
         
         # Find matches
         matched = resume_skills_set.intersection(job_skills_set)
-        missing = job_skills_set.difference(resume_skills_set)
-        extra = resume_skills_set.difference(job_skills_set)
         
         # Calculate percentage
         match_percentage = (len(matched) / len(job_skills_set)) * 100 if job_skills_set else 0
         
         # Convert back to original case
-        matched_skills = [s for s in job_skills if s.lower() in matched]
-        missing_skills = [s for s in job_skills if s.lower() in missing]
-        extra_skills = [s for s in resume_skills if s.lower() in extra]
+        matched_skills = []
+        missing_skills = []
+        for skill, key in zip(job_skills, job_skill_keys):
+            if key in matched:
+                matched_skills.append(skill)
+            else:
+                missing_skills.append(skill)
+        extra_skills = [s for s, key in zip(resume_skills, resume_skill_keys) if key not in job_skills_set]
         
         return {
             'match_percentage': round(match_percentage, 2),
@@ -234,6 +263,64 @@ class ResumeJobMatcher:
             'meets_requirement': meets_requirement
         }
     
+    def encode_text(self, text):
+        """
+        Normalized transformer embedding of a text, for storing alongside it
+        
+        Parameters:
+        -----------
+        text : str
+            Text to encode
+            
+        Returns:
+        --------
+        np.ndarray or None
+            Normalized float32 embedding, or None if transformers are disabled
+        """
+        
+        if not self.use_transformers or not self.transformer:
+            return None
+        
+        try:
+            return np.asarray(self.transformer.encode(text, normalize_embeddings=True), dtype=np.float32)
+        except:
+            return None
+    
+    def prepare_job(self, job_data, embedding=None):
+        """
+        Precompute the job-side inputs shared by every resume scored against a job
+        
+        Parameters:
+        -----------
+        job_data : dict
+            Job description data
+        embedding : np.ndarray, optional
+            Normalized job embedding computed earlier (skips the transformer)
+            
+        Returns:
+        --------
+        dict
+            Job skills and their lowercased keys, education level, raw text
+            and (if transformers are enabled) the normalized job embedding
+        """
+        
+        job_text = job_data.get('raw_text', '')
+        
+        if embedding is not None:
+            embedding = np.asarray(embedding, dtype=np.float32)
+        else:
+            embedding = self.encode_text(job_text)
+        
+        skills = job_data.get('skills', {}).get('skills', [])
+        
+        return {
+            'skills': skills,
+            'skill_keys': [s.lower() for s in skills],
+            'education': job_data.get('education', {}).get('highest_level', 'unknown'),
+            'raw_text': job_text,
+            'embedding': embedding
+        }
+    
     def calculate_overall_fit_score(self, resume_data, job_data, weights=None):
         """
         Calculate overall fit score combining multiple factors
@@ -253,6 +340,73 @@ class ResumeJobMatcher:
             Complete matching results
         """
         
+        return self.score_against(resume_data, self.prepare_job(job_data), weights)
+    
+    def batch_semantic_similarity(self, resume_texts, prepared_job, batch_size=32):
+        """
+        Semantic similarity of many resumes to a prepared job in one pass
+        
+        All resume texts go through the transformer as batches and are scored
+        with a single matrix-vector product against the job embedding.
+        
+        Parameters:
+        -----------
+        resume_texts : list
+            Resume texts
+        prepared_job : dict
+            Output of prepare_job
+        batch_size : int
+            Encoder batch size
+            
+        Returns:
+        --------
+        list
+            Similarity scores (0-100), one per resume
+        """
+        
+        if not resume_texts or not self.use_transformers or prepared_job['embedding'] is None:
+            return [0.0] * len(resume_texts)
+        
+        try:
+            embeddings = self.transformer.encode(
+                resume_texts,
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            # Reduced-precision models return FP16 embeddings; score in FP32
+            similarities = np.asarray(embeddings, dtype=np.float32) @ prepared_job['embedding']
+            return [round(float(s) * 100, 2) for s in similarities]
+        except:
+            return [0.0] * len(resume_texts)
+    
+    def score_against(self, resume_data, prepared_job, weights=None, semantic_sim=None, min_skill_match=0):
+        """
+        Calculate overall fit score against a job prepared with prepare_job
+        
+        Only the resume side is encoded, so scoring many resumes against one
+        job runs the job through the transformer once.
+        
+        Parameters:
+        -----------
+        resume_data : dict
+            Resume profile data
+        prepared_job : dict
+            Output of prepare_job
+        weights : dict
+            Weights for different factors
+        semantic_sim : float
+            Precomputed semantic similarity (e.g. from batch_semantic_similarity)
+        min_skill_match : float
+            Skill match percentage below which text and semantic similarity
+            are skipped and scored as 0 (0 disables the cutoff)
+            
+        Returns:
+        --------
+        dict
+            Complete matching results
+        """
+        
         # Default weights
         if weights is None:
             weights = {
@@ -265,10 +419,10 @@ class ResumeJobMatcher:
         
         # Extract skills
         resume_skills = resume_data.get('skills', {}).get('skills', [])
-        job_skills = job_data.get('skills', {}).get('skills', [])
+        job_skills = prepared_job['skills']
         
         # Calculate skill match
-        skill_match = self.calculate_skill_match(resume_skills, job_skills)
+        skill_match = self.calculate_skill_match(resume_skills, job_skills, prepared_job['skill_keys'])
         
         # Calculate experience match
         resume_years = resume_data.get('years_experience', 0)
@@ -277,18 +431,22 @@ class ResumeJobMatcher:
         
         # Calculate education match
         resume_edu = resume_data.get('education', {}).get('highest_level', 'unknown')
-        job_edu = job_data.get('education', {}).get('highest_level', 'unknown')
+        job_edu = prepared_job['education']
         education_match = self.calculate_education_match(resume_edu, job_edu)
         
-        # Calculate text similarity
-        resume_text = resume_data.get('raw_text', '')
-        job_text = job_data.get('raw_text', '')
-        text_sim = self.calculate_text_similarity(resume_text, job_text)
-        
-        # Calculate semantic similarity (if enabled)
-        semantic_sim = 0
-        if self.use_transformers:
-            semantic_sim = self.calculate_semantic_similarity(resume_text, job_text)
+        # Calculate text and semantic similarity, unless the skill overlap is
+        # already below the cutoff
+        if self._below_skill_cutoff(skill_match['match_percentage'], prepared_job, min_skill_match):
+            text_sim = 0.0
+            semantic_sim = 0.0
+        else:
+            resume_text = resume_data.get('raw_text', '')
+            job_text = prepared_job['raw_text']
+            text_sim = self.calculate_text_similarity(resume_text, job_text)
+            
+            # Semantic similarity (if enabled), unless the caller batched it
+            if semantic_sim is None:
+                semantic_sim = self.batch_semantic_similarity([resume_text], prepared_job)[0]
         
         # Calculate weighted overall score
         overall_score = (
@@ -319,7 +477,69 @@ class ResumeJobMatcher:
             'semantic_similarity': semantic_sim,
             'weights_used': weights
         }
-
+    
+    def _below_skill_cutoff(self, match_percentage, prepared_job, min_skill_match):
+        """Whether a skill match is too low to be worth the similarity calculations"""
+        return bool(min_skill_match) and bool(prepared_job['skills']) and match_percentage < min_skill_match
+    
+    def _skill_match_percentage(self, resume_skills, prepared_job):
+        """Skill match percentage alone (as calculate_skill_match computes it)"""
+        job_skills_set = set(prepared_job['skill_keys'])
+        if not job_skills_set:
+            return 0
+        matched = job_skills_set.intersection(s.lower() for s in resume_skills)
+        return round(len(matched) / len(job_skills_set) * 100, 2)
+    
+    def batch_score(self, resume_profiles, prepared_job, weights=None, semantic_sims=None, min_skill_match=0):
+        """
+        Score many resumes against one prepared job
+        
+        The resumes are encoded in a single batched transformer pass
+        (batch_semantic_similarity) before the per-resume fit scores.
+        
+        Parameters:
+        -----------
+        resume_profiles : list
+            Resume profile dicts
+        prepared_job : dict
+            Output of prepare_job
+        weights : dict
+            Weights for different factors
+        semantic_sims : list
+            Precomputed semantic similarities (e.g. from stored embeddings)
+        min_skill_match : float
+            Skill match cutoff passed to score_against; resumes below it are
+            not encoded at all
+            
+        Returns:
+        --------
+        list
+            Matching results (as from score_against), one per resume
+        """
+        
+        if semantic_sims is None:
+            # Only resumes that clear the skill cutoff go through the transformer
+            encode = [
+                i for i, p in enumerate(resume_profiles)
+                if not self._below_skill_cutoff(
+                    self._skill_match_percentage(p.get('skills', {}).get('skills', []), prepared_job),
+                    prepared_job,
+                    min_skill_match
+                )
+            ]
+            encoded_sims = self.batch_semantic_similarity(
+                [resume_profiles[i].get('raw_text', '') for i in encode],
+                prepared_job
+            )
+            semantic_sims = [0.0] * len(resume_profiles)
+            for i, sim in zip(encode, encoded_sims):
+                semantic_sims[i] = sim
+        
+        return [
+            self.score_against(resume_profile, prepared_job, weights, semantic_sim=semantic_sim,
+                               min_skill_match=min_skill_match)
+            for resume_profile, semantic_sim in zip(resume_profiles, semantic_sims)
+        ]
 
 def main():
     """Test the matcher"""
@@ -5,7 +5,10 @@ Extract skills from resume and job description text using NLP
 import spacy
 import re
 from fuzzywuzzy import fuzz
-from collections import Counter
+from collections import Counter, OrderedDict
+import threading
+import hashlib
+import copy
 import sys
 import os
 
@@ -45,8 +48,19 @@ class SkillExtractor:
         self.all_skills = get_all_skills()
         self.all_skills_lower = {skill.lower(): skill for skill in self.all_skills}
         
+        # Word-bounded pattern per skill, compiled once rather than per call
+        self.skill_patterns = [
+            (skill_lower, re.compile(r'\b' + re.escape(skill_lower) + r'\b'), skill_original)
+            for skill_lower, skill_original in self.all_skills_lower.items()
+        ]
+        
         # Fuzzy matching threshold (0-100)
         self.fuzzy_threshold = 85
+        
+        # Profiles keyed by a hash of text and sections (LRU)
+        self.profile_cache_size = 4096
+        self._profile_cache = OrderedDict()
+        self._profile_cache_lock = threading.Lock()
     
     def extract_skills(self, text, use_fuzzy=True):
         """
@@ -73,12 +87,14 @@ class SkillExtractor:
         
         # Method 1: Exact matching (case-insensitive)
         text_lower = text.lower()
-        for skill_lower, skill_original in self.all_skills_lower.items():
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill_lower) + r'\b'
-            matches = re.finditer(pattern, text_lower)
+        for skill_lower, pattern, skill_original in self.skill_patterns:
+            # A skill can only match where it occurs as a substring, so the
+            # word-boundary regex only runs on the few skills that appear
+            if skill_lower not in text_lower:
+                continue
             
-            for match in matches:
+            # Use word boundaries to avoid partial matches
+            for match in pattern.finditer(text_lower):
                 found_skills.add(skill_original)
                 skill_positions.append({
                     'skill': skill_original,
@@ -283,6 +299,42 @@ class SkillExtractor:
             'certifications': certifications,
             'section_skills': section_skills
         }
+    
+    def extract_complete_profile_cached(self, text, sections=None):
+        """
+        extract_complete_profile, memoized on the text and sections
+        
+        Parameters:
+        -----------
+        text : str
+            Full text
+        sections : dict
+            Pre-extracted sections (optional)
+            
+        Returns:
+        --------
+        dict
+            A fresh copy of the profile, so callers may modify it
+        """
+        
+        key = hashlib.blake2b(
+            (text + repr(sorted((sections or {}).items()))).encode('utf-8', 'surrogatepass'),
+            digest_size=16
+        ).digest()
+        
+        with self._profile_cache_lock:
+            profile = self._profile_cache.get(key)
+            if profile is not None:
+                self._profile_cache.move_to_end(key)
+        
+        if profile is None:
+            profile = self.extract_complete_profile(text, sections)
+            with self._profile_cache_lock:
+                self._profile_cache[key] = profile
+                if len(self._profile_cache) > self.profile_cache_size:
+                    self._profile_cache.popitem(last=False)
+        
+        return copy.deepcopy(profile)
 
 
 def main():